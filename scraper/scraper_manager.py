@@ -6,15 +6,18 @@ import sys
 import time
 from datetime import timedelta
 from collections import defaultdict
+from functools import cached_property
 # ✅ STEP 5: ThreadPoolExecutor for optimized parallel scraping (5-10 threads)
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Optional, Tuple
 from django.conf import settings
+from django.db import DatabaseError, IntegrityError, transaction
 from django.utils import timezone
 from .scrapers import get_scraper, SCRAPER_REGISTRY
 from .models import Job, DecisionMaker, ScraperLog, CompanyCache
 from .utils.decision_maker_finder import DecisionMakerFinder
 from .utils.company_enrichment import CompanyEnrichment
+from .utils.driver_pool import shared_pool as DRIVER_POOL
 from urllib.parse import urlparse
 from dashboard.models import JobPortal, SavedFilter, ScraperRun, Keyword
 import re
@@ -30,6 +33,9 @@ except Exception:
     pass
 
 
+# ✅ Jobs are inserted with bulk_create in batches of this size (also bounds IN-list lookups)
+SAVE_BATCH_SIZE = 100
+
 GENERIC_COMPANY_TOKENS = {
     'company', 'employer', 'hiringcompany', 'hiringmanager', 'confidential', 'unknown', 'na', 'n/a',
     'notprovided', 'notdisclosed', 'privatelyheld'
@@ -111,6 +117,7 @@ class ScraperManager:
         self.scraper_run.save()
         print(f"✅ Scraper run status set to RUNNING")
         
+        DRIVER_POOL.begin_run()
         try:
             # Get ALL scraping parameters - NO LIMITS
             # Get keywords as strings
@@ -682,6 +689,10 @@ class ScraperManager:
                 'status': 'error',
                 'error': str(e)
             }
+        finally:
+            # Selenium drivers stay warm across portals - once the run is over, wait for portal
+            # threads still holding one and quit them all (drivers shared with a concurrent run stay up)
+            DRIVER_POOL.end_run()
     
     def _scrape_portal(self, portal: JobPortal, keywords: List[str]) -> List[Dict]:
         """
@@ -1033,9 +1044,15 @@ class ScraperManager:
             Number of jobs saved
         """
         saved_count = 0
+        pending_jobs: List[Job] = []
+        portal_cache: Dict[int, Optional[JobPortal]] = {}
         
         logger.info(f"_save_jobs: Received {len(jobs_data)} jobs to process")
         
+        # ✅ One query for already-stored links instead of an EXISTS query per job
+        existing_links = self._existing_job_links(jobs_data)
+        cancelled = False
+        
         for idx, job_data in enumerate(jobs_data):
             if idx < 3:  # Log first 3 for debugging
                 logger.info(f"_save_jobs: Processing job {idx+1}: '{job_data.get('job_title', 'N/A')}' from {job_data.get('company', 'N/A')}")
@@ -1043,12 +1060,10 @@ class ScraperManager:
                 logger.debug(f"  Initial company size: {job_data.get('company_size', 'None')}")
                 logger.debug(f"  Company profile URL: {job_data.get('company_profile_url', 'None')}")
             try:
-                # Stop saving if cancelled or run removed
+                # Stop saving if cancelled or run removed (_is_cancelled treats a deleted run as cancelled)
                 if self._is_cancelled():
-                    break
-                from dashboard.models import ScraperRun as ScrRun
-                if not ScrRun.objects.filter(id=self.scraper_run.id).exists():
-                    logger.warning("ScraperRun deleted during save; aborting saves")
+                    logger.warning("ScraperRun cancelled or deleted during save; aborting saves")
+                    cancelled = True
                     break
                 # Enforce filter accuracy BEFORE saving
                 if not self._job_matches_filter(job_data):
@@ -1063,7 +1078,7 @@ class ScraperManager:
                     logger.debug(f"Job '{job_title}' matches filter, proceeding to save...")
                 # Check if job already exists (by job_link)
                 job_link = job_data.get('job_link', '')
-                if Job.objects.filter(job_link=job_link).exists():
+                if job_link in existing_links:
                     logger.debug(f"Job already exists: {job_link}")
                     self._record_skip('duplicate')
                     continue
@@ -1077,7 +1092,9 @@ class ScraperManager:
                 
                 # Get portal
                 portal_id = job_data.pop('portal_id', None)
-                portal = JobPortal.objects.get(id=portal_id) if portal_id else None
+                if portal_id and portal_id not in portal_cache:
+                    portal_cache[portal_id] = JobPortal.objects.get(id=portal_id)
+                portal = portal_cache.get(portal_id) if portal_id else None
                 
                 # Fill missing company from job link hostname if needed
                 job_title = job_data.get('job_title', '').strip()
@@ -1224,7 +1241,9 @@ class ScraperManager:
                     job_data.get('job_description', '')
                 )
 
-                job = Job.objects.create(
+                # Queue for bulk insert; the link is reserved so in-batch duplicates are skipped too
+                existing_links.add(job_link)
+                pending_jobs.append(Job(
                     job_title=job_title,
                     company=company_name,
                     company_url=company_url or None,  # Store None instead of empty string
@@ -1239,21 +1258,12 @@ class ScraperManager:
                     job_type=job_type_value,
                     salary_range=job_data.get('salary_range', ''),
                     scraper_run=self.scraper_run
-                )
-                
-                # Find decision makers for the job (async to not block scraping)
-                try:
-                    self._find_decision_makers(job, max_results=3)
-                except Exception as e:
-                    logger.warning(f"Error finding decision makers for {job.company}: {str(e)}")
-                
-                saved_count += 1
-                
-                # Log every job for debugging
-                logger.info(f"✅ SAVED job #{saved_count}: '{job_title}' at {company_name} (portal: {portal.name if portal else 'N/A'})")
+                ))
                 
-                # Log every 10 jobs to track progress
-                if saved_count % 10 == 0:
+                # Flush a full batch so the UI keeps streaming results
+                if len(pending_jobs) >= SAVE_BATCH_SIZE:
+                    saved_count += self._bulk_save_jobs(pending_jobs)
+                    pending_jobs = []
                     logger.info(f"💾 Saved {saved_count} jobs so far...")
                 
             except Exception as e:
@@ -1263,6 +1273,14 @@ class ScraperManager:
                 self._record_skip('exception')
                 continue
         
+        # A cancelled/deleted run keeps nothing from the unflushed tail of the batch
+        if pending_jobs and not cancelled:
+            try:
+                saved_count += self._bulk_save_jobs(pending_jobs)
+            except Exception as e:
+                logger.error(f"❌ Error saving jobs: {str(e)}")
+                self._record_skip('exception')
+        
         logger.info(f"_save_jobs: Complete - saved {saved_count}/{len(jobs_data)} jobs")
         
         # Print summary
@@ -1277,6 +1295,55 @@ class ScraperManager:
         
         return saved_count
 
+    def _existing_job_links(self, jobs_data: List[Dict]) -> set:
+        """Return the job links from jobs_data that are already stored (chunked IN queries)"""
+        links = list({job.get('job_link', '') for job in jobs_data if job.get('job_link')})
+        existing = set()
+        for start in range(0, len(links), SAVE_BATCH_SIZE):
+            chunk = links[start:start + SAVE_BATCH_SIZE]
+            existing.update(Job.objects.filter(job_link__in=chunk).values_list('job_link', flat=True))
+        return existing
+
+    def _bulk_save_jobs(self, pending_jobs: List[Job]) -> int:
+        """
+        Insert a batch of jobs with one bulk_create, then find their decision makers.
+        Falls back to row-by-row inserts if the batch hits a database error, so only
+        the offending rows are lost.
+        
+        Returns:
+            Number of jobs saved
+        """
+        try:
+            with transaction.atomic():
+                created = Job.objects.bulk_create(pending_jobs, batch_size=SAVE_BATCH_SIZE)
+        except DatabaseError as e:
+            logger.warning(f"Bulk insert failed ({e}); saving batch row by row")
+            created = []
+            for job in pending_jobs:
+                try:
+                    with transaction.atomic():
+                        job.save(force_insert=True)
+                    created.append(job)
+                except IntegrityError:
+                    logger.debug(f"Job already exists: {job.job_link}")
+                    self._record_skip('duplicate')
+                except DatabaseError as row_err:
+                    logger.warning(f"Could not save job {job.job_link}: {row_err}")
+                    self._record_skip('database_error')
+        
+        for job in created:
+            # Find decision makers for the job
+            try:
+                self._find_decision_makers(job, max_results=3)
+            except Exception as e:
+                logger.warning(f"Error finding decision makers for {job.company}: {str(e)}")
+            
+            # Log every job for debugging
+            portal = job.source_job_portal
+            logger.info(f"✅ SAVED job: '{job.job_title}' at {job.company} (portal: {portal.name if portal else 'N/A'})")
+        
+        return len(created)
+
     def _record_skip(self, reason: str):
         self.skip_reasons[reason] += 1
 
@@ -1331,6 +1398,25 @@ class ScraperManager:
         self._log_skip_summary()
 
     # ======= Central filter validator =======
+    @cached_property
+    def _filter_keywords(self) -> List[str]:
+        """
+        ✅ Lower-cased SavedFilter keywords plus the significant tokens of long multi-word ones -
+        queried and built once per run instead of once per scraped job
+        """
+        lowered_keywords = [k.lower() for k in self.saved_filter.keywords.values_list('name', flat=True)]
+        
+        # For fuzzy matching - split keywords into tokens for better matching
+        tokenized_keywords = []
+        for kw in lowered_keywords:
+            # Split multi-word keywords into individual words for better matching
+            if ' ' in kw and len(kw) > 10:  # Only for longer multi-word keywords
+                tokenized_keywords.extend(kw.split())
+        
+        # Keep only tokens that are significant (3+ chars) and add them to the keyword list
+        lowered_keywords.extend(t for t in tokenized_keywords if len(t) > 2)
+        return lowered_keywords
+
     def _job_matches_filter(self, job: Dict) -> bool:
         """Apply SavedFilter rules to a scraped job dict with improved matching."""
         relaxed = self.relax_filters
@@ -1338,24 +1424,8 @@ class ScraperManager:
         # Keyword: title (and optionally description) must contain a keyword
         title = (job.get('job_title') or '').lower()
         description = (job.get('job_description') or '').lower()
-        keywords = list(self.saved_filter.keywords.values_list('name', flat=True))
-        if keywords:
-            lowered_keywords = [k.lower() for k in keywords]
-            
-            # For fuzzy matching - split keywords into tokens for better matching
-            tokenized_keywords = []
-            for kw in lowered_keywords:
-                # Split multi-word keywords into individual words for better matching
-                if ' ' in kw and len(kw) > 10:  # Only for longer multi-word keywords
-                    tokenized_keywords.extend(kw.split())
-                    
-            # Add tokenized keywords if we have any
-            if tokenized_keywords:
-                # Keep only tokens that are significant (3+ chars)
-                significant_tokens = [t for t in tokenized_keywords if len(t) > 2]
-                # Add these tokens to our keyword list for matching
-                lowered_keywords.extend(significant_tokens)
-                    
+        lowered_keywords = self._filter_keywords
+        if lowered_keywords:
             # Different matching logic based on relaxed mode
             if relaxed:
                 combined_text = f"{title} {description}".strip()
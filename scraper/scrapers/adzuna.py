@@ -1,12 +1,10 @@
 """Adzuna Job Scraper - MULTI-APPROACH: Tries multiple methods to fetch maximum jobs"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, LINK_STRAINER, LISTING_STRAINER, company_size_from_text, extract_job_posting, html_text, infer_company_from_url, lower_keys
 from ..utils.multi_approach_scraper import MultiApproachExtractor
 import urllib.parse
 from urllib.parse import urljoin
-import json
 import logging
-import re
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +25,8 @@ class AdzunaScraper(BaseScraper):
         """MULTI-APPROACH: Try multiple methods to fetch maximum jobs"""
         jobs = []
         seen_job_links = set()
+        # Index of the (URL format, transport) pair that last worked - usually the same for every keyword
+        preferred_attempt = None
         
         for keyword in self.keywords:
             # APPROACH 1: Try multiple URL formats
@@ -38,25 +38,24 @@ class AdzunaScraper(BaseScraper):
             
             soup = None
             
-            # Try each URL format
-            for url in url_formats:
-                try:
-                    # APPROACH 2: Try direct request first
-                    html = self.make_request(url, use_selenium=False)
-                    if html and len(html) > 1000:
-                        soup = self.parse_html(html)
-                        break
-                except:
-                    continue
-                
-                # APPROACH 3: Fallback to Selenium
+            # Try each URL format - APPROACH 2: direct request first, APPROACH 3: Selenium fallback
+            attempts = [(url, use_selenium) for url in url_formats for use_selenium in (False, True)]
+            order = list(range(len(attempts)))
+            if preferred_attempt is not None:
+                order.remove(preferred_attempt)
+                order.insert(0, preferred_attempt)
+            
+            for index in order:
+                url, use_selenium = attempts[index]
                 try:
-                    html = self.make_request(url, use_selenium=True)
-                    if html and len(html) > 1000:
-                        soup = self.parse_html(html)
-                        break
-                except:
+                    html = self.make_request(url, use_selenium=use_selenium)
+                except Exception:
                     continue
+                # Length check before parsing - only the accepted page is ever parsed
+                if html and len(html) > 1000:
+                    soup = self.parse_html(html, parse_only=LISTING_STRAINER)
+                    preferred_attempt = index
+                    break
             
             if not soup:
                 logger.warning(f"Adzuna: Could not fetch HTML for keyword '{keyword}'")
@@ -71,6 +70,8 @@ class AdzunaScraper(BaseScraper):
             
             logger.info(f"Adzuna: Found {len(job_cards)} job cards using multi-approach for '{keyword}'")
             
+            # PHASE 1: Extract card data (no network I/O) into compact records
+            candidates = []
             for card in job_cards:
                 try:
                     # ✅ SIMPLE EXTRACTION - Like original approach
@@ -121,7 +122,8 @@ class AdzunaScraper(BaseScraper):
                         if company_elem:
                             company = self.clean_text(company_elem.get_text())
                     
-                    posted_date = self.parse_date(card.find('span', class_='posted').get_text() if hasattr(card, 'find') and card.find('span', class_='posted') else '')
+                    posted_elem = card.find('span', class_='posted') if hasattr(card, 'find') else None
+                    posted_date = self.parse_date(posted_elem.get_text() if posted_elem else '')
                     
                     # Extract location from card
                     location = ''
@@ -130,37 +132,51 @@ class AdzunaScraper(BaseScraper):
                         if location_elem:
                             location = self.clean_text(location_elem.get_text())
                     
-                    # ALWAYS fetch job detail page to get REAL data (NO "Unknown")
+                    candidates.append(JobRecord(
+                        job_title=job_title,
+                        company=company,
+                        market='UK',
+                        job_link=job_link,
+                        posted_date=posted_date,
+                        location=location,
+                    ))
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Adzuna: Card skipped: {e}")
+                    continue
+            
+            # PHASE 2: ALWAYS fetch job detail pages to get REAL data (NO "Unknown") - in parallel
+            details = self.fetch_details_concurrently([c.job_link for c in candidates])
+            
+            # PHASE 3: Merge card data with detail data
+            for candidate in candidates:
+                try:
+                    job_title = candidate.job_title
+                    job_link = candidate.job_link
+                    company = candidate.company
+                    posted_date = candidate.posted_date
+                    location = candidate.location
+                    
                     company_profile_url = None
                     company_url = None
                     company_size = ''
                     job_description = ''
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            job_description = detail.get('description', '') or detail.get('job_description', '')
-                            if detail.get('posted_date') and not posted_date:
-                                posted_date = detail['posted_date']
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size') and detail['company_size'] not in ['UNKNOWN', 'Unknown', '']:
-                                company_size = detail['company_size']
-                            if detail.get('location') and not location:
-                                location = detail['location']
-                    except Exception as e:
-                        logger.debug(f"Adzuna: Error fetching job detail for {job_link}: {e}")
+                    detail = details.get(job_link)
+                    if detail:
+                        job_description = detail.get('description', '') or detail.get('job_description', '')
+                        if detail.get('posted_date') and not posted_date:
+                            posted_date = detail['posted_date']
+                        if detail.get('company') and not company:
+                            company = detail['company']
+                        company_url = detail.get('company_url')
+                        company_profile_url = detail.get('company_profile_url')
+                        if detail.get('company_size') and detail['company_size'] not in ['UNKNOWN', 'Unknown', '']:
+                            company_size = detail['company_size']
+                        if detail.get('location') and not location:
+                            location = detail['location']
                     
                     # If still no company, infer from job link
                     if not company or company.lower() in ['unknown', 'company not listed', '']:
-                        try:
-                            from urllib.parse import urlparse
-                            domain = urlparse(job_link).netloc
-                            if domain:
-                                company = domain.replace('www.', '').split('.')[0].title()
-                        except:
-                            company = 'Company Not Listed'
+                        company = infer_company_from_url(job_link)
                     
                     # ✅ REMOVED STRICT FILTERS - Let all jobs through
                     # Only check time filter if date is available
@@ -175,23 +191,21 @@ class AdzunaScraper(BaseScraper):
                     
                     # ONLY require job_title (company can be inferred)
                     if job_title:
-                        job_data = {
-                            'job_title': job_title,
-                            'company': company if company else 'Company Not Listed',
-                            'company_url': company_url or '',
-                            'company_size': company_size or '',  # Empty string instead of "UNKNOWN"
-                            'company_profile_url': company_profile_url or None,
-                            'market': 'UK',
-                            'job_link': job_link,
-                            'posted_date': posted_date,
-                            'location': location if location else '',
-                            'job_description': job_description if job_description else '',
-                            'job_type': detected_type,
-                        }
-                        # ✅ Ensure all fields have real data - no "Unknown" values
-                        job_data = self.ensure_real_data(job_data)
+                        record = candidate._replace(
+                            company=company if company else 'Company Not Listed',
+                            company_url=company_url or '',
+                            company_size=company_size or '',  # Empty string instead of "UNKNOWN"
+                            company_profile_url=company_profile_url or None,
+                            posted_date=posted_date,
+                            location=location if location else '',
+                            job_description=job_description if job_description else '',
+                            job_type=detected_type,
+                        )
+                        # ✅ Materialize to a dict only at the boundary; ensure no "Unknown" values
+                        job_data = self.ensure_real_data(record._asdict())
                         jobs.append(job_data)
-                except:
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"Adzuna: Card skipped: {e}")
                     continue
         return jobs
     
@@ -206,39 +220,39 @@ class AdzunaScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            # Extract company URL from the JobPosting JSON-LD (matched from raw HTML, before any DOM parse)
+            posting = extract_job_posting(html)
+            if posting:
+                try:
+                    hiring = posting.get('hiringorganization')
+                    if isinstance(hiring, dict):
+                        hiring = lower_keys(hiring)
+                        company_url = hiring.get('sameas') or hiring.get('url')
+                        if company_url:
+                            detail['company_url'] = company_url
+                            logger.debug(f"Adzuna: Found company URL from JSON-LD: {company_url}")
+                        name = hiring.get('name')
+                        if name:
+                            detail['company'] = self.clean_text(name)
+                    description = posting.get('description')
+                    if description:
+                        detail['description'] = self.clean_text(description)
+                    date_posted = posting.get('dateposted')
+                    if date_posted:
+                        parsed = self.parse_date(date_posted)
+                        if parsed:
+                            detail['posted_date'] = parsed
+                except (AttributeError, KeyError, TypeError) as e:
+                    logger.debug(f"Adzuna: JobPosting JSON-LD skipped: {e}")
+            
+            # Only links are read from the detail page DOM (company size is matched on the raw HTML)
+            soup = self.parse_html(html, parse_only=LINK_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                                logger.debug(f"Adzuna: Found company URL from JSON-LD: {company_url}")
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
-            
             # Extract company URL from HTML if not found in JSON-LD
             if not detail.get('company_url'):
                 # Try common selectors for company website
@@ -261,27 +275,12 @@ class AdzunaScraper(BaseScraper):
             
             # Extract company size from HTML if available
             if not detail.get('company_size'):
-                # Try to find company size in text
-                all_text = soup.get_text()
-                size_patterns = [
-                    r'company\s*size[:\s]+(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                    r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                    r'(\d{1,3}(?:,\d{3})*)\s*employees?',
-                ]
-                for pattern in size_patterns:
-                    match = re.search(pattern, all_text, re.IGNORECASE)
-                    if match:
-                        if len(match.groups()) == 2:
-                            min_val = int(match.group(1).replace(',', ''))
-                            max_val = int(match.group(2).replace(',', ''))
-                            detail['company_size'] = self._parse_company_size_from_range(min_val, max_val)
-                            logger.debug(f"Adzuna: Found company size from HTML: {min_val}-{max_val}")
-                            break
-                        else:
-                            count = int(match.group(1).replace(',', ''))
-                            detail['company_size'] = self._parse_company_size_from_count(count)
-                            logger.debug(f"Adzuna: Found company size from HTML: {count}")
-                            break
+                # The soup only holds links - scan the page text (tags and <script> bodies stripped,
+                # so sizes split by markup still match and script data doesn't)
+                company_size = company_size_from_text(html_text(html))
+                if company_size:
+                    detail['company_size'] = company_size
+                    logger.debug(f"Adzuna: Found company size from HTML: {company_size}")
         except Exception as e:
             logger.debug(f"Adzuna: Error fetching job detail: {e}")
         
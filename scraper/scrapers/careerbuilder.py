@@ -1,14 +1,24 @@
 """CareerBuilder Scraper - MULTI-APPROACH: Tries multiple methods to fetch maximum jobs"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, LISTING_STRAINER, LINK_STRAINER, extract_job_posting, infer_company_from_url, lower_keys, JOB_CARD_CLASS_CSS
 from ..utils.multi_approach_scraper import MultiApproachExtractor
 import urllib.parse
-import json
 import logging
 import re
+import soupsieve
 
 logger = logging.getLogger(__name__)
 
+_JOB_LINK_RE = re.compile(r'/job|/position|/career|/vacancy', re.I)
+
+# Job card containers - fused into one selector (page walked once) and compiled once at import
+_JOB_CARD_SELECTOR = soupsieve.compile(', '.join([
+    'div[data-testid="job-result-item"]',
+    f':is(div, article, li){JOB_CARD_CLASS_CSS}',
+    '[data-job-id]',
+    '[data-job]',
+]))
+
 class CareerBuilderScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -32,47 +42,20 @@ class CareerBuilderScraper(BaseScraper):
             html = self.make_request(url, use_selenium=True)
             if not html:
                 continue
-            soup = self.parse_html(html)
-            # Try multiple selectors to get maximum jobs
-            job_cards = []
-            selectors_to_try = [
-                ('div', {'data-testid': 'job-result-item'}),
-                ('div', {'class': 'job-result-item'}),
-                ('div', {'class': 'job'}),
-                ('article', {'class': 'job'}),
-                ('li', {'class': 'job'}),
-                ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-                ('article', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ]
-            
-            for tag, attrs in selectors_to_try:
-                found = soup.find_all(tag, attrs)
-                if found:
-                    job_cards.extend(found)
-                    logger.debug(f"CareerBuilder: Found {len(found)} cards with {tag} {attrs}")
-            
-            # Also try CSS selectors
-            if not job_cards:
-                css_selectors = [
-                    'div[data-testid*="job"]',
-                    'div[class*="job"]',
-                    'article[class*="job"]',
-                    'li[class*="job"]',
-                    '[data-job-id]',
-                    '[data-job]',
-                ]
-                for selector in css_selectors:
-                    found = soup.select(selector)
-                    if found:
-                        job_cards.extend(found)
-                        logger.debug(f"CareerBuilder: Found {len(found)} cards with CSS selector {selector}")
+            soup = self.parse_html(html, parse_only=LISTING_STRAINER)
+            # Try all card selectors in one pass (select() returns each element once, in document order)
+            job_cards = _JOB_CARD_SELECTOR.select(soup)
+            if job_cards:
+                logger.debug(f"CareerBuilder: Found {len(job_cards)} cards with fused selector")
             
             # Try finding any links that look like job links
             if not job_cards:
-                job_links = soup.find_all('a', href=re.compile(r'/job|/position|/career|/vacancy', re.I))
+                job_links = soup.find_all('a', href=_JOB_LINK_RE)
+                seen_parents = set()  # identity set - Tag equality compares whole subtrees
                 for link in job_links:
                     parent = link.find_parent(['div', 'article', 'li'])
-                    if parent and parent not in job_cards:
+                    if parent is not None and id(parent) not in seen_parents:
+                        seen_parents.add(id(parent))
                         job_cards.append(parent)
                         logger.debug(f"CareerBuilder: Found job card from link {link.get('href', '')[:50]}")
             
@@ -94,11 +77,13 @@ class CareerBuilderScraper(BaseScraper):
                     title_elem = card.find('h2')
                     if not title_elem:
                         continue
-                    job_link = self.base_url + card.find('a')['href'] if card.find('a') else ''
+                    link_elem = card.find('a')
+                    job_link = self.base_url + link_elem['href'] if link_elem else ''
                     if not job_link:
                         continue
                     
-                    company = self.clean_text(card.find('div', attrs={'data-testid': 'job-company'}).get_text() if card.find('div', attrs={'data-testid': 'job-company'}) else '') or ''
+                    company_elem = card.find('div', attrs={'data-testid': 'job-company'})
+                    company = self.clean_text(company_elem.get_text()) if company_elem else ''
                     
                     # ALWAYS fetch job detail page to get REAL data (NO "Unknown")
                     company_profile_url = None
@@ -106,7 +91,8 @@ class CareerBuilderScraper(BaseScraper):
                     company_size = ''
                     job_description = ''
                     posted_date = None
-                    location = self.clean_text(card.find('div', attrs={'data-testid': 'job-location'}).get_text() if card.find('div', attrs={'data-testid': 'job-location'}) else '') or ''
+                    location_elem = card.find('div', attrs={'data-testid': 'job-location'})
+                    location = self.clean_text(location_elem.get_text()) if location_elem else ''
                     try:
                         detail = self._fetch_job_detail(job_link)
                         if detail:
@@ -125,13 +111,7 @@ class CareerBuilderScraper(BaseScraper):
                     
                     # If still no company, infer from job link
                     if not company or company.lower() in ['unknown', 'company not listed', '']:
-                        try:
-                            from urllib.parse import urlparse
-                            domain = urlparse(job_link).netloc
-                            if domain:
-                                company = domain.replace('www.', '').split('.')[0].title()
-                        except:
-                            company = 'Company Not Listed'
+                        company = infer_company_from_url(job_link)
                     
                     # ✅ REMOVED STRICT FILTERS - Let all jobs through
                     # Detect job type
@@ -163,7 +143,8 @@ class CareerBuilderScraper(BaseScraper):
                             'job_type': detected_type,
                         }
                         jobs.append(job_data)
-                except:
+                except (AttributeError, KeyError, TypeError, ValueError) as e:
+                    logger.debug(f"CareerBuilder: Card skipped: {e}")
                     continue
         return jobs
     
@@ -178,37 +159,37 @@ class CareerBuilderScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            # Only links are read from the detail page DOM
+            soup = self.parse_html(html, parse_only=LINK_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
+            # Extract company URL from the JobPosting JSON-LD (matched from raw HTML)
+            posting = extract_job_posting(html)
+            if posting:
                 try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+                    hiring = posting.get('hiringorganization')
+                    if isinstance(hiring, dict):
+                        hiring = lower_keys(hiring)
+                        company_url = hiring.get('sameas') or hiring.get('url')
+                        if company_url:
+                            detail['company_url'] = company_url
+                        name = hiring.get('name')
+                        if name:
+                            detail['company'] = self.clean_text(name)
+                    description = posting.get('description')
+                    if description:
+                        detail['description'] = self.clean_text(description)
+                    date_posted = posting.get('dateposted')
+                    if date_posted:
+                        parsed = self.parse_date(date_posted)
+                        if parsed:
+                            detail['posted_date'] = parsed
+                except (AttributeError, KeyError, TypeError) as e:
+                    logger.debug(f"CareerBuilder: JobPosting JSON-LD skipped: {e}")
         except Exception as e:
             logger.debug(f"CareerBuilder: Error fetching job detail: {e}")
         
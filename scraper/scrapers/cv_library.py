@@ -1,14 +1,93 @@
 """CV-Library Job Scraper"""
-import json
 import logging
 import re
 import urllib.parse
+from functools import cached_property
 from typing import List, Dict, Optional
 
-from ..utils.base_scraper import BaseScraper
+import soupsieve
+from bs4 import SoupStrainer
+
+from ..utils.base_scraper import BaseScraper, card_strainer, company_size_from_text, extract_job_posting, html_text, lower_keys
 
 logger = logging.getLogger(__name__)
 
+# Card fields - one grouped selector per field, so a card is walked once per field
+_COMPANY_SELECTOR = soupsieve.compile(', '.join((
+    '[data-testid="job-card-company-name"]',
+    'span.company',
+    'span.job__company',
+    '.job__details__company',
+)))
+_LOCATION_SELECTOR = soupsieve.compile(', '.join((
+    '[data-testid="job-card-location"]',
+    'span.location',
+    '.job__details__location',
+    '.job__meta__location',
+)))
+_DATE_SELECTOR = soupsieve.compile(', '.join((
+    '[data-testid="job-card-date"]',
+    '.job__details__date',
+    '.job__meta__date',
+)))
+
+_COMPANY_NAME_SELECTOR = soupsieve.compile('h1, h2.company-name')
+
+# Placeholder "company" names CV-Library shows when the employer is hidden
+_GENERIC_COMPANY_NAMES = frozenset({'cv-library', 'company', 'employer', 'unknown'})
+
+# Two alphanumeric characters anywhere ([^\W_] is exactly str.isalnum)
+_COMPANY_TOKEN_RE = re.compile(r'[^\W_].*?[^\W_]', re.DOTALL)
+
+# Market / employment normalisation tables
+_UK_MARKET_RE = re.compile(r'UNITED KINGDOM|\bUK\b', re.IGNORECASE)
+_USA_MARKET_RE = re.compile(r'UNITED STATES|\bUSA\b', re.IGNORECASE)
+_REMOTE_WORKPLACES = frozenset({'REMOTE', 'TELECOMMUTE'})
+_EMPLOYMENT_SEPARATORS_RE = re.compile(r'[-_\s]')
+_EMPLOYMENT_TYPES = {
+    'FULLTIME': 'FULL_TIME',
+    'PARTTIME': 'PART_TIME',
+    'CONTRACT': 'FREELANCE',
+    'TEMPORARY': 'FREELANCE',
+}
+
+# Detail/profile selectors (compiled once, tried in priority order)
+_COMPANY_DETAIL_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    '[data-testid="job-company-name"]',
+    '.job-header__company-name',
+    '.job-header__company a',
+    '.job-header__company',
+    '.company span',
+))
+_WEBSITE_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'a[href^="http"]:not([href*="cv-library.co.uk"]):not([href*="cvlibrary.co.uk"])',
+    '.company-website a',
+    'a.company-link[href^="http"]',
+))
+
+def _attr_text(attrs: Dict, name: str) -> str:
+    value = attrs.get(name) or ''
+    # Multi-valued attributes are still raw strings while strainers run, lists afterwards
+    return ' '.join(value) if isinstance(value, list) else value
+
+
+def _is_detail_node(name: str, attrs: Dict) -> bool:
+    if name == 'a':
+        return True
+    marker = f"{_attr_text(attrs, 'class')} {_attr_text(attrs, 'data-testid')}".lower()
+    return 'job' in marker or 'company' in marker
+
+
+# Raw-HTML probe for a job card - decides whether a plain HTTP search page is usable
+_JOB_CARD_RE = re.compile(r'<(?:article|div)\b[^>]*\bclass=["\'](?:[^"\']*\s)?job[\s"\']', re.IGNORECASE)
+
+# ✅ SoupStrainers: search pages keep only job cards, detail pages only links and the
+# job/company containers the detail selectors read (JSON-LD is matched on the raw HTML)
+_CARD_STRAINER = card_strainer(('article', 'div'), token='job')
+_DETAIL_STRAINER = SoupStrainer(_is_detail_node)
+# Company profiles: website links and the name heading (size is matched on the raw HTML)
+_PROFILE_STRAINER = SoupStrainer(['a', 'h1', 'h2'])
+
 
 class CVLibraryScraper(BaseScraper):
     @property
@@ -24,12 +103,17 @@ class CVLibraryScraper(BaseScraper):
         return True
     
     def build_search_url(self, keyword: str) -> str:
+        # Only the keyword varies between searches - geo/posted are encoded once per scraper
+        return f"{self.base_url}/search-jobs?q={urllib.parse.quote_plus(keyword)}{self._search_url_filters}"
+
+    @cached_property
+    def _search_url_filters(self) -> str:
         params = {
-            'q': keyword,
             'geo': '' if self.location == 'ALL' else self.location,
             'posted': self._map_time_filter(),
         }
-        return f"{self.base_url}/search-jobs?{urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})}"
+        encoded = urllib.parse.urlencode({k: v for k, v in params.items() if v is not None})
+        return f"&{encoded}" if encoded else ''
     
     def _map_time_filter(self) -> str:
         mapping = {
@@ -41,142 +125,166 @@ class CVLibraryScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs: List[Dict] = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            html = self.make_request(url, use_selenium=True)
-            if not html:
-                logger.warning(f"CV-Library: no HTML returned for keyword '{keyword}'")
-                continue
-            soup = self.parse_html(html)
-            job_cards = soup.find_all('article', class_='job') or soup.select('div.job')
-            for card in job_cards:
-                try:
-                    title_elem = card.find('h2') or card.select_one('a.job__title')
-                    if not title_elem:
-                        continue
-                    job_title = self.clean_text(title_elem.get_text())
-                    # ✅ DYNAMIC KEYWORD FILTER: Check ALL keywords, not just current one
-                    keyword_match = False
-                    if self.keywords:
-                        keyword_match = any(
-                            self.matches_keyword(job_title, kw) 
-                            for kw in self.keywords
-                        )
-                    else:
-                        keyword_match = True  # No keywords = accept all
-                    
-                    if not keyword_match:
-                        continue
-
-                    link_elem = title_elem.find('a') if title_elem else None
-                    job_href = link_elem['href'] if link_elem and link_elem.has_attr('href') else None
-                    if job_href and not job_href.startswith('http'):
-                        job_link = urllib.parse.urljoin(self.base_url, job_href)
-                    else:
-                        job_link = job_href or ''
-                    if not job_link:
-                        continue
-
-                    company_raw = self._extract_company(card)
-                    company = company_raw or ''
-
-                    location = self._extract_location(card)
-                    posted_date = self._extract_posted_date(card)
-
-                    detail = self._fetch_job_detail(job_link)
-                    company_url = detail.get('company_url')
-                    
-                    if detail.get('company'):
-                        company = detail['company']
-                    if detail.get('location'):
-                        location = detail['location']
-                    if detail.get('posted_date'):
-                        posted_date = detail['posted_date']
-                    
-                    # Fetch company profile/detail page for real company URL and size
-                    company_profile_url = detail.get('company_profile_url')
-                    if company_profile_url:
-                        profile_data = self._fetch_company_profile(company_profile_url)
-                        if profile_data:
-                            # Use real website URL from company profile
-                            if profile_data.get('website_url'):
-                                company_url = profile_data['website_url']
-                            # Use real company size from profile
-                            if profile_data.get('company_size'):
-                                detail['company_size'] = profile_data['company_size']
-                            # Update company name if different
-                            if profile_data.get('company_name'):
-                                company = profile_data['company_name']
-
-                    if not self.should_include_job(posted_date):
-                        continue
-
-                    job_description = detail.get('job_description', '')
-
-                    company_token = ''.join(ch for ch in company if ch.isalnum())
-                    if not company_token or len(company_token) < 2:
-                        continue
-
-                    detected_type = self.detect_job_type(job_title, location, job_description)
-                    if detected_type == 'UNKNOWN':
-                        mapped = self._map_employment(detail.get('employment_type'), detail.get('workplace_type'))
-                        if mapped:
-                            detected_type = mapped
-
-                    if not self.matches_job_type_filter(detected_type):
-                        continue
-
-                    jobs.append({
-                        'job_title': job_title,
-                        'company': company,
-                        'company_url': company_url,  # Real company website URL from profile
-                        'company_size': detail.get('company_size', 'UNKNOWN'),  # Real size from profile
-                        'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
-                        'market': self._infer_market(location),
-                        'job_link': job_link,
-                        'posted_date': posted_date,
-                        'location': location or 'Unknown',
-                        'job_description': job_description,
-                        'job_type': detected_type,
-                        'salary_range': detail.get('salary_range', ''),
-                    })
-                except Exception as exc:
-                    logger.debug(f"CV-Library: failed to parse job card: {exc}")
+
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+
+        candidates: List[Dict] = []
+        seen_job_links = set()  # the same posting often shows up under several keywords
+
+        def _candidate_links(pages):
+            # PHASE 1: Extract card data (no network I/O) - each link goes to the detail
+            # pool as soon as its card is parsed, so parsing overlaps the detail page loads
+            for keyword, html in zip(self.keywords, pages):
+                if not html:
+                    logger.warning(f"CV-Library: no HTML returned for keyword '{keyword}'")
+                    continue
+                for candidate in self._parse_search_page(html, seen_job_links):
+                    candidates.append(candidate)
+                    yield candidate['job_link']
+
+        # ✅ Search pages for all keywords load in parallel and are parsed (in keyword order) as they arrive
+        # PHASE 2: Job detail pages, fetched in parallel while the remaining search pages are parsed
+        details = self.fetch_details_concurrently(_candidate_links(self.fetch_search_pages(search_urls)))
+
+        # ✅ Company profiles are shared by many postings - fetch each one once, in parallel
+        profile_urls = list(dict.fromkeys(
+            d['company_profile_url'] for d in details.values() if d.get('company_profile_url')
+        ))
+        profiles = self.fetch_details_concurrently(profile_urls, fetch=self._fetch_company_profile)
+
+        # PHASE 3: Merge card data with detail/profile data
+        for candidate in candidates:
+            try:
+                job_title = candidate['job_title']
+                job_link = candidate['job_link']
+                company = candidate['company']
+                location = candidate['location']
+                posted_date = candidate['posted_date']
+
+                detail = details.get(job_link) or {}
+                company_url = detail.get('company_url')
+                
+                if detail.get('company'):
+                    company = detail['company']
+                if detail.get('location'):
+                    location = detail['location']
+                if detail.get('posted_date'):
+                    posted_date = detail['posted_date']
+                
+                # Company profile/detail page gives the real company URL and size
+                company_profile_url = detail.get('company_profile_url')
+                profile_data = profiles.get(company_profile_url) if company_profile_url else None
+                if profile_data:
+                    # Use real website URL from company profile
+                    if profile_data.get('website_url'):
+                        company_url = profile_data['website_url']
+                    # Use real company size from profile
+                    if profile_data.get('company_size'):
+                        detail['company_size'] = profile_data['company_size']
+                    # Update company name if different
+                    if profile_data.get('company_name'):
+                        company = profile_data['company_name']
+
+                if not self.should_include_job(posted_date):
+                    continue
+
+                job_description = detail.get('job_description', '')
+
+                # Need at least two alphanumeric characters to count as a real company name
+                if not _COMPANY_TOKEN_RE.search(company):
                     continue
+
+                detected_type = self.detect_job_type(job_title, location, job_description)
+                if detected_type == 'UNKNOWN':
+                    mapped = self._map_employment(detail.get('employment_type'), detail.get('workplace_type'))
+                    if mapped:
+                        detected_type = mapped
+
+                if not self.matches_job_type_filter(detected_type):
+                    continue
+
+                jobs.append({
+                    'job_title': job_title,
+                    'company': company,
+                    'company_url': company_url,  # Real company website URL from profile
+                    'company_size': detail.get('company_size', 'UNKNOWN'),  # Real size from profile
+                    'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
+                    'market': self._infer_market(location),
+                    'job_link': job_link,
+                    'posted_date': posted_date,
+                    'location': location or 'Unknown',
+                    'job_description': job_description,
+                    'job_type': detected_type,
+                    'salary_range': detail.get('salary_range', ''),
+                })
+            except Exception as exc:
+                logger.debug(f"CV-Library: failed to parse job card: {exc}")
+                continue
         return jobs
 
+    def _parse_search_page(self, html: str, seen_job_links: set):
+        """Yield card data for new, keyword-matching job cards on a search results page"""
+        soup = self.parse_html(html, parse_only=_CARD_STRAINER)
+        job_cards = soup.find_all('article', class_='job') or soup.select('div.job')
+        for card in job_cards:
+            try:
+                title_elem = card.find('h2') or card.select_one('a.job__title')
+                if not title_elem:
+                    continue
+                job_title = self.clean_text(title_elem.get_text())
+                # ✅ DYNAMIC KEYWORD FILTER: Check ALL keywords, not just current one
+                # No keywords = accept all
+                if self.keywords and not self.matches_any_keyword(job_title):
+                    continue
+
+                link_elem = title_elem.find('a') if title_elem else None
+                job_href = link_elem['href'] if link_elem and link_elem.has_attr('href') else None
+                if job_href and not job_href.startswith('http'):
+                    job_link = urllib.parse.urljoin(self.base_url, job_href)
+                else:
+                    job_link = job_href or ''
+                if not job_link or job_link in seen_job_links:
+                    continue
+                seen_job_links.add(job_link)
+
+                candidate = {
+                    'job_title': job_title,
+                    'job_link': job_link,
+                    'company': self._extract_company(card) or '',
+                    'location': self._extract_location(card),
+                    'posted_date': self._extract_posted_date(card),
+                }
+            except Exception as exc:
+                logger.debug(f"CV-Library: failed to parse job card: {exc}")
+                continue
+            yield candidate
+
+    def _fetch_search_page(self, url: str) -> Optional[str]:
+        # ✅ Search results are server-rendered - plain HTTP first, Selenium only when blocked or card-less
+        html = self.make_request_fast(url)
+        if html and _JOB_CARD_RE.search(html):
+            return html
+        return super()._fetch_search_page(url)
+
     def _extract_company(self, card) -> str:
-        selectors = [
-            '[data-testid="job-card-company-name"]',
-            'span.company',
-            'span.job__company',
-            '.job__details__company',
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
-            if elem:
-                company = self.clean_text(elem.get_text())
-                if company:
-                    return company
+        # First match in document order with non-empty text
+        for elem in _COMPANY_SELECTOR.iselect(card):
+            company = self.clean_text(elem.get_text())
+            if company:
+                return company
         return ''
 
     def _extract_location(self, card) -> str:
-        selectors = [
-            '[data-testid="job-card-location"]',
-            'span.location',
-            '.job__details__location',
-            '.job__meta__location',
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
-            if elem:
-                location = self.clean_text(elem.get_text())
-                if location:
-                    return location
+        for elem in _LOCATION_SELECTOR.iselect(card):
+            location = self.clean_text(elem.get_text())
+            if location:
+                return location
         return ''
 
     def _extract_posted_date(self, card):
-        time_elem = card.find('time') or card.select_one('time')
+        time_elem = card.find('time')
         if time_elem:
             if time_elem.has_attr('datetime'):
                 raw = time_elem['datetime']
@@ -189,16 +297,10 @@ class CVLibraryScraper(BaseScraper):
             parsed = self.parse_date(text)
             if parsed:
                 return parsed
-        date_candidates = [
-            card.select_one('[data-testid="job-card-date"]'),
-            card.select_one('.job__details__date'),
-            card.select_one('.job__meta__date'),
-        ]
-        for elem in date_candidates:
-            if elem:
-                parsed = self.parse_date(self.clean_text(elem.get_text()))
-                if parsed:
-                    return parsed
+        for elem in _DATE_SELECTOR.iselect(card):
+            parsed = self.parse_date(self.clean_text(elem.get_text()))
+            if parsed:
+                return parsed
         return None
 
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
@@ -210,63 +312,57 @@ class CVLibraryScraper(BaseScraper):
         if not html:
             return detail
 
-        soup = self.parse_html(html)
-
-        company_selectors = [
-            '[data-testid="job-company-name"]',
-            '.job-header__company-name',
-            '.job-header__company a',
-            '.job-header__company',
-            '.company span',
-        ]
-        for selector in company_selectors:
-            elem = soup.select_one(selector)
+        soup = self.parse_html(html, parse_only=_DETAIL_STRAINER)
+
+        for selector in _COMPANY_DETAIL_SELECTORS:
+            elem = selector.select_one(soup)
             if elem:
                 name = self.clean_text(elem.get_text())
-                if name and name.lower() not in {'cv-library', 'company', 'employer', 'unknown'}:
+                if name and name.lower() not in _GENERIC_COMPANY_NAMES:
                     detail['company'] = name
                     break
 
-        for script in soup.find_all('script', type='application/ld+json'):
+        # ✅ JobPosting JSON-LD read straight from the raw HTML (no script nodes in the tree)
+        posting = extract_job_posting(html)
+        if posting:
             try:
-                data = json.loads(script.get_text(strip=True) or '{}')
-            except Exception:
-                continue
-            if isinstance(data, dict):
-                hiring = data.get('hiringOrganization') or data.get('hiringorganization')
+                hiring = posting.get('hiringorganization')
                 if isinstance(hiring, dict):
+                    hiring = lower_keys(hiring)
                     name = hiring.get('name')
                     if name and 'company' not in detail:
                         name_clean = self.clean_text(name)
-                        if name_clean and name_clean.lower() not in {'cv-library', 'company', 'employer', 'unknown'}:
+                        if name_clean and name_clean.lower() not in _GENERIC_COMPANY_NAMES:
                             detail['company'] = name_clean
-                    company_url = hiring.get('sameAs') or hiring.get('url')
+                    company_url = hiring.get('sameas') or hiring.get('url')
                     if company_url:
                         detail['company_url'] = company_url
-                
-                date_posted = data.get('datePosted') or data.get('dateposted')
-                if date_posted and 'posted_date' not in detail:
+
+                date_posted = posting.get('dateposted')
+                if date_posted:
                     parsed = self.parse_date(date_posted)
                     if parsed:
                         detail['posted_date'] = parsed
-                description = data.get('description')
-                if description and 'job_description' not in detail:
+                description = posting.get('description')
+                if description:
                     detail['job_description'] = self.clean_text(description)
 
-                employment = data.get('employmentType')
+                employment = posting.get('employmenttype')
                 if isinstance(employment, list):
                     employment = employment[0] if employment else None
                 detail['employment_type'] = employment
 
-                workplace = data.get('jobLocationType') or data.get('workplaceType')
+                workplace = posting.get('joblocationtype') or posting.get('workplacetype')
                 if isinstance(workplace, list):
-                    workplace = workplace[0]
+                    workplace = workplace[0] if workplace else None
                 detail['workplace_type'] = workplace
-            
-            # Extract company profile URL from CV-Library job detail page using BaseScraper method
-            company_profile_url = self._extract_company_profile_url(soup)
-            if company_profile_url:
-                detail['company_profile_url'] = company_profile_url
+            except (AttributeError, KeyError, TypeError) as exc:
+                logger.debug(f"CV-Library: JobPosting JSON-LD skipped: {exc}")
+
+        # Extract company profile URL from CV-Library job detail page using BaseScraper method
+        company_profile_url = self._extract_company_profile_url(soup)
+        if company_profile_url:
+            detail['company_profile_url'] = company_profile_url
 
         if 'location' not in detail:
             loc_elem = soup.select_one('[data-testid="job-location"]') or soup.select_one('.job-header__location')
@@ -291,17 +387,11 @@ class CVLibraryScraper(BaseScraper):
             if not html:
                 return profile_data
             
-            soup = self.parse_html(html)
+            soup = self.parse_html(html, parse_only=_PROFILE_STRAINER)
             
             # Extract company website URL from CV-Library company profile
-            website_selectors = [
-                'a[href^="http"]:not([href*="cv-library.co.uk"]):not([href*="cvlibrary.co.uk"])',
-                '.company-website a',
-                'a.company-link[href^="http"]',
-            ]
-            
-            for selector in website_selectors:
-                website_link = soup.select_one(selector)
+            for selector in _WEBSITE_SELECTORS:
+                website_link = selector.select_one(soup)
                 if website_link:
                     href = website_link.get('href', '')
                     if href and href.startswith('http') and 'cv-library.co.uk' not in href and 'cvlibrary.co.uk' not in href:
@@ -309,31 +399,15 @@ class CVLibraryScraper(BaseScraper):
                         logger.info(f"Found website URL from CV-Library company profile: {href}")
                         break
             
-            # Extract company size from CV-Library company profile
-            all_text = soup.get_text()
-            size_patterns = [
-                r'company\s*size[:\s]+(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                r'(\d{1,3}(?:,\d{3})*)\s*employees?',
-            ]
-            
-            for pattern in size_patterns:
-                match = re.search(pattern, all_text, re.IGNORECASE)
-                if match:
-                    if len(match.groups()) == 2:
-                        min_val = int(match.group(1).replace(',', ''))
-                        max_val = int(match.group(2).replace(',', ''))
-                        profile_data['company_size'] = self._parse_company_size_from_range(min_val, max_val)
-                        logger.info(f"Found company size from CV-Library profile: {min_val}-{max_val}")
-                        break
-                    else:
-                        count = int(match.group(1).replace(',', ''))
-                        profile_data['company_size'] = self._parse_company_size_from_count(count)
-                        logger.info(f"Found company size from CV-Library profile: {count}")
-                        break
+            # Extract company size from CV-Library company profile - one pass over the page text
+            # (script/style and tags stripped first, so "<b>250</b> employees" still matches)
+            company_size = company_size_from_text(html_text(html))
+            if company_size:
+                profile_data['company_size'] = company_size
+                logger.info(f"Found company size from CV-Library profile: {company_size}")
             
             # Extract company name from profile
-            company_name_elem = soup.find('h1') or soup.find('h2', class_='company-name')
+            company_name_elem = _COMPANY_NAME_SELECTOR.select_one(soup)
             if company_name_elem:
                 company_name = self.clean_text(company_name_elem.get_text())
                 if company_name:
@@ -344,73 +418,23 @@ class CVLibraryScraper(BaseScraper):
         
         return profile_data
 
-    def _parse_company_size_from_count(self, count: any) -> str:
-        """Convert employee count to size category (LinkedIn standard)"""
-        try:
-            if isinstance(count, str):
-                count = int(''.join(filter(str.isdigit, count)))
-            else:
-                count = int(count)
-            
-            if count >= 10001:
-                return 'ENTERPRISE'
-            elif count >= 1001:
-                return 'LARGE'
-            elif count >= 51:
-                return 'MEDIUM'
-            else:
-                return 'SMALL'
-        except:
-            return 'UNKNOWN'
-    
-    def _parse_company_size_from_range(self, min_val: any, max_val: any) -> str:
-        """Convert employee range to size category"""
-        try:
-            if isinstance(min_val, str):
-                min_val = int(''.join(filter(str.isdigit, min_val)))
-            else:
-                min_val = int(min_val)
-            
-            if isinstance(max_val, str):
-                max_val = int(''.join(filter(str.isdigit, max_val)))
-            else:
-                max_val = int(max_val)
-            
-            if max_val >= 10001:
-                return 'ENTERPRISE'
-            elif max_val >= 1001:
-                return 'LARGE'
-            elif max_val >= 51:
-                return 'MEDIUM'
-            else:
-                return 'SMALL'
-        except:
-            return 'UNKNOWN'
-
     def _map_employment(self, employment: Optional[str], workplace: Optional[str]) -> Optional[str]:
-        employment_upper = (employment or '').upper()
         workplace_upper = (workplace or '').upper()
-
-        if workplace_upper in {'REMOTE', 'TELECOMMUTE'}:
+        if workplace_upper in _REMOTE_WORKPLACES:
             return 'REMOTE'
         if workplace_upper == 'HYBRID':
             return 'HYBRID'
 
-        mapping = {
-            'FULLTIME': 'FULL_TIME',
-            'FULL-TIME': 'FULL_TIME',
-            'PARTTIME': 'PART_TIME',
-            'PART-TIME': 'PART_TIME',
-            'CONTRACT': 'FREELANCE',
-            'TEMPORARY': 'FREELANCE',
-        }
-        return mapping.get(employment_upper)
+        # FULL_TIME / Full-time / full time -> FULLTIME
+        key = _EMPLOYMENT_SEPARATORS_RE.sub('', (employment or '').upper())
+        return _EMPLOYMENT_TYPES.get(key)
 
     def _infer_market(self, location: str) -> str:
-        loc_upper = (location or '').upper()
-        if 'UNITED KINGDOM' in loc_upper or 'UK' in loc_upper:
+        if not location:
+            return 'OTHER'
+        if _UK_MARKET_RE.search(location):
             return 'UK'
-        if 'UNITED STATES' in loc_upper or 'USA' in loc_upper:
+        if _USA_MARKET_RE.search(location):
             return 'USA'
         return 'OTHER'
 
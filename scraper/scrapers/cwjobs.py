@@ -1,13 +1,32 @@
 """CWjobs Scraper"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, LINK_STRAINER, LISTING_STRAINER, extract_job_posting, lower_keys, JOB_CARD_CLASS_CSS
 import urllib.parse
-import json
 import logging
 import re
+import soupsieve
 
 logger = logging.getLogger(__name__)
 
+# Job card containers - fused into one selector (page walked once, results in document order)
+# and compiled once at import
+_JOB_CARD_SELECTOR = soupsieve.compile(f':is(div, article, li){JOB_CARD_CLASS_CSS}')
+
+# Tried one by one when no whole-token card class matched above - looser substring matches
+# (these can also hit wrappers such as div.jobs-list, so they only run as a last resort)
+_FALLBACK_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'div[class*="job"]',
+    'article[class*="job"]',
+    'li[class*="job"]',
+    '[data-job-id]',
+    '[data-job]',
+))
+
+# Title links inside a card (any class containing "title")
+_TITLE_LINK_SELECTOR = soupsieve.compile('a[class*="title" i]')
+
+_JOB_LINK_RE = re.compile(r'/job|/position|/career|/vacancy', re.I)
+
 class CWJobsScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -22,52 +41,44 @@ class CWJobsScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        seen_job_links = set()
+        candidates: List[JobRecord] = []
+        # Selectors that found the cards on the previous page - the markup is the same for
+        # every keyword, so they are tried first and the cascade only runs when they miss
+        card_selectors = ()
         for keyword in self.keywords:
             url = self.build_search_url(keyword)
             html = self.make_request(url)
             if not html:
                 continue
-            soup = self.parse_html(html)
-            # Try multiple selectors to get maximum jobs
-            job_cards = []
-            selectors_to_try = [
-                ('div', {'class': 'job'}),
-                ('article', {'class': 'job'}),
-                ('li', {'class': 'job'}),
-                ('div', {'class': 'job-card'}),
-                ('div', {'class': 'job-item'}),
-                ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-                ('article', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ]
+            # Cards, link-parent fallback and MultiApproachExtractor only need div/article/li/a
+            soup = self.parse_html(html, parse_only=LISTING_STRAINER)
+            job_cards = [card for selector in card_selectors for card in selector.select(soup)]
             
-            for tag, attrs in selectors_to_try:
-                found = soup.find_all(tag, attrs)
-                if found:
-                    job_cards.extend(found)
-                    logger.debug(f"CWjobs: Found {len(found)} cards with {tag} {attrs}")
+            # Try multiple selectors to get maximum jobs (one pass over the page)
+            if not job_cards:
+                job_cards = _JOB_CARD_SELECTOR.select(soup)
+                card_selectors = (_JOB_CARD_SELECTOR,) if job_cards else ()
+                if job_cards:
+                    logger.debug(f"CWjobs: Found {len(job_cards)} cards with job card selector")
             
-            # Also try CSS selectors
+            # Also try CSS selectors - the first productive one wins (later ones mostly re-match the same cards)
             if not job_cards:
-                css_selectors = [
-                    'div[class*="job"]',
-                    'article[class*="job"]',
-                    'li[class*="job"]',
-                    '[data-job-id]',
-                    '[data-job]',
-                ]
-                for selector in css_selectors:
-                    found = soup.select(selector)
+                for selector in _FALLBACK_CARD_SELECTORS:
+                    found = selector.select(soup)
                     if found:
-                        job_cards.extend(found)
-                        logger.debug(f"CWjobs: Found {len(found)} cards with CSS selector {selector}")
+                        job_cards = found
+                        card_selectors = (selector,)
+                        logger.debug(f"CWjobs: Found {len(found)} cards with CSS selector {selector.pattern}")
+                        break
             
             # Try finding any links that look like job links
             if not job_cards:
-                job_links = soup.find_all('a', href=re.compile(r'/job|/position|/career|/vacancy', re.I))
+                job_links = soup.find_all('a', href=_JOB_LINK_RE)
+                seen_parents = set()  # by identity - Tag == compares whole subtrees
                 for link in job_links:
                     parent = link.find_parent(['div', 'article', 'li'])
-                    if parent and parent not in job_cards:
+                    if parent is not None and id(parent) not in seen_parents:
+                        seen_parents.add(id(parent))
                         job_cards.append(parent)
                         logger.debug(f"CWjobs: Found job card from link {link.get('href', '')[:50]}")
             
@@ -86,17 +97,19 @@ class CWJobsScraper(BaseScraper):
             logger.info(f"CWjobs: Found {len(job_cards)} job cards for '{keyword}'")
             
             for card in job_cards:
+                # Cards from the fallbacks are not guaranteed to be elements
+                if not hasattr(card, 'find'):
+                    continue
+                
                 try:
                     # ✅ SIMPLE EXTRACTION - Try multiple methods
-                    title_elem = None
-                    if hasattr(card, 'find'):
-                        title_elem = card.find('h2') or card.find('h3') or card.find('h1') or \
-                                   card.find('a', class_=lambda x: x and 'title' in x.lower())
+                    title_elem = card.find('h2') or card.find('h3') or card.find('h1') or \
+                               _TITLE_LINK_SELECTOR.select_one(card)
                     
-                    if not title_elem:
+                    if title_elem is None:
                         continue
                     
-                    job_title = self.clean_text(title_elem.get_text()) if hasattr(title_elem, 'get_text') else str(title_elem).strip()
+                    job_title = self.clean_text(title_elem.get_text())
                     
                     if not job_title or len(job_title) < 3:
                         continue
@@ -104,64 +117,50 @@ class CWJobsScraper(BaseScraper):
                     # ✅ REMOVED STRICT KEYWORD CHECK - Extract all jobs
                     
                     # Extract job link
-                    job_link = ''
-                    if hasattr(card, 'find'):
-                        link_elem = card.find('a')
-                        if link_elem and link_elem.get('href'):
-                            href = link_elem['href']
-                            job_link = self.base_url + href if not href.startswith('http') else href
-                    
-                    if not job_link:
+                    link_elem = card.find('a')
+                    href = link_elem.get('href') if link_elem else None
+                    if not href:
                         continue
+                    job_link = urllib.parse.urljoin(self.base_url, href)  # absolute, root- and protocol-relative hrefs
                     
                     # Deduplicate by job link
-                    if job_link in seen_job_links:
+                    if not self.is_new_link(job_link):
                         continue
-                    seen_job_links.add(job_link)
                     
                     # Extract company
-                    company = ''
-                    if hasattr(card, 'find'):
-                        company_elem = card.find('span', class_='company')
-                        if company_elem:
-                            company = self.clean_text(company_elem.get_text())
+                    company_elem = card.find('span', class_='company')
+                    company = self.clean_text(company_elem.get_text()) if company_elem else ''
                     
-                    # Fetch job detail page to get company profile URL and additional info
-                    company_profile_url = None
-                    company_url = None
-                    company_size = 'UNKNOWN'
-                    job_description = ''
-                    posted_date = None
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            job_description = detail.get('description', '')
-                            posted_date = detail.get('posted_date')
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size'):
-                                company_size = detail['company_size']
-                    except Exception as e:
-                        logger.debug(f"CWjobs: Error fetching job detail for {job_link}: {e}")
+                    location_elem = card.find('span', class_='location')
                     
-                    job_data = {
-                        'job_title': self.clean_text(title_elem.get_text()),
-                        'company': company,
-                        'company_url': company_url,
-                        'company_size': company_size,
-                        'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
-                        'market': 'UK',
-                        'job_link': job_link,
-                        'posted_date': posted_date,
-                        'location': self.clean_text(card.find('span', class_='location').get_text() if card.find('span', class_='location') else ''),
-                        'job_description': job_description,
-                        'job_type': self.job_type if self.job_type != 'ALL' else 'UNKNOWN',
-                    }
-                    jobs.append(job_data)
-                except:
+                    candidates.append(JobRecord(
+                        job_title=job_title,
+                        company=company,
+                        market='UK',
+                        job_link=job_link,
+                        location=self.clean_text(location_elem.get_text() if location_elem else ''),
+                    ))
+                except (AttributeError, ValueError) as e:
+                    # One malformed card (missing node, unparseable href) must not end the scrape
+                    logger.warning(f"CWjobs: Skipping malformed job card: {e}")
                     continue
+        
+        # ✅ Job detail pages (company profile URL and additional info), fetched in parallel
+        details = self.fetch_details_concurrently([c.job_link for c in candidates])
+        
+        for candidate in candidates:
+            detail = details.get(candidate.job_link) or {}
+            record = candidate._replace(
+                company=candidate.company or detail.get('company') or '',
+                company_url=detail.get('company_url'),
+                company_size=detail.get('company_size') or 'UNKNOWN',
+                company_profile_url=detail.get('company_profile_url'),  # Pass for ScraperManager enrichment
+                posted_date=detail.get('posted_date'),
+                job_description=detail.get('description', ''),
+                job_type=self.job_type if self.job_type != 'ALL' else 'UNKNOWN',
+            )
+            # ✅ Materialize to a dict only at the boundary
+            jobs.append(record._asdict())
         return jobs
     
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
@@ -175,7 +174,8 @@ class CWJobsScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            # Only the profile link scan needs the DOM - JSON-LD is read from the raw HTML
+            soup = self.parse_html(html, parse_only=LINK_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
@@ -183,29 +183,23 @@ class CWJobsScraper(BaseScraper):
                 detail['company_profile_url'] = company_profile_url
             
             # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+            posting = extract_job_posting(html)
+            if posting:
+                hiring = lower_keys(posting.get('hiringorganization'))
+                company_url = hiring.get('sameas') or hiring.get('url')
+                if company_url:
+                    detail['company_url'] = company_url
+                name = hiring.get('name')
+                if name:
+                    detail['company'] = self.clean_text(name)
+                description = posting.get('description')
+                if description:
+                    detail['description'] = self.clean_text(description)
+                date_posted = posting.get('dateposted')
+                if date_posted:
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
         except Exception as e:
             logger.debug(f"CWjobs: Error fetching job detail: {e}")
         
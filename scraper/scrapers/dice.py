@@ -1,14 +1,60 @@
 """Dice Scraper"""
-import json
 import logging
-import re
 import urllib.parse
+import soupsieve
 from typing import List, Dict, Optional
 
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, LINK_STRAINER, card_strainer, company_size_from_text, extract_job_posting, lower_keys
 
 logger = logging.getLogger(__name__)
 
+
+# ✅ Search pages: only build the div.card subtrees (everything the card loop reads)
+_CARD_STRAINER = card_strainer(('div',), token='card')
+
+# Profile blocks that usually hold the company size - scanned before the whole page
+_COMPANY_INFO_SELECTOR = soupsieve.compile(
+    'section[class*="company"], div[class*="overview"], div[class*="info"]'
+)
+
+# (tag, class) -> card field read by the card loop
+_CARD_FIELDS = {
+    ('a', 'companyName'): 'company',
+    ('span', 'posted'): 'posted',
+    ('span', 'location'): 'location',
+    ('a', 'card-title-link'): 'link',
+}
+
+
+def _card_fields(card) -> Dict:
+    """Collect the first h5/company/posted/location/title-link element of a card in one walk"""
+    fields = {}
+    for elem in card.find_all(['h5', 'a', 'span']):
+        if elem.name == 'h5':
+            fields.setdefault('title', elem)
+            continue
+        for cls in elem.get('class') or ():
+            field = _CARD_FIELDS.get((elem.name, cls))
+            if field:
+                fields.setdefault(field, elem)
+    return fields
+
+
+def _posting_fields(posting: Dict) -> tuple:
+    """(company, company_url, address parts, salary value) from a JobPosting, whatever its key casing"""
+    hiring = lower_keys(posting.get('hiringorganization'))
+    job_location = posting.get('joblocation')
+    if isinstance(job_location, list):
+        job_location = job_location[0] if job_location else None
+    address = lower_keys(lower_keys(job_location).get('address'))
+    value = lower_keys(lower_keys(posting.get('basesalary')).get('value'))
+    return (
+        hiring.get('name'),
+        hiring.get('sameas') or hiring.get('url'),
+        (address.get('addresslocality'), address.get('addressregion'), address.get('addresscountry')),
+        (value.get('minvalue'), value.get('maxvalue'), value.get('unittext')),
+    )
+
 class DiceScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -27,106 +73,133 @@ class DiceScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            html = self.make_request(url, use_selenium=True)
+        candidates: List[JobRecord] = []
+
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+
+        # ✅ Search pages for all keywords load in parallel (each worker checks out its own pooled driver)
+        pages = self.fetch_search_pages(search_urls)
+
+        for html in pages:
             if not html:
                 continue
-            soup = self.parse_html(html)
+            soup = self.parse_html(html, parse_only=_CARD_STRAINER)
             job_cards = soup.find_all('div', class_='card')
             for card in job_cards:
-                try:
-                    title_elem = card.find('h5')
-                    if not title_elem:
-                        continue
-                    
-                    job_title = self.clean_text(title_elem.get_text())
-                    
-                    # ✅ STRICT KEYWORD MATCHING
-                    # ✅ DYNAMIC KEYWORD FILTER: Check ALL keywords, not just current one
-                    keyword_match = False
-                    if self.keywords:
-                        keyword_match = any(
-                            self.matches_keyword(job_title, kw) 
-                            for kw in self.keywords
-                        )
-                    else:
-                        keyword_match = True  # No keywords = accept all
-                    
-                    if not keyword_match:
-                        continue
-                    
-                    company = self.clean_text(card.find('a', class_='companyName').get_text() if card.find('a', class_='companyName') else '')
-                    company_url = None
-                    
-                    posted_text = card.find('span', class_='posted').get_text() if card.find('span', class_='posted') else ''
-                    posted_date = self.parse_date(posted_text)
-                    location_text = self.clean_text(card.find('span', class_='location').get_text() if card.find('span', class_='location') else '')
-
-                    job_link = self.base_url + card.find('a', class_='card-title-link')['href'] if card.find('a', class_='card-title-link') else ''
-
-                    detail = self._fetch_job_detail(job_link)
-                    description = detail.get('description', '')
-                    company_url = detail.get('company_url')
-                    
-                    if detail.get('company'):
-                        company = detail['company']
-                    if detail.get('posted_date'):
-                        posted_date = detail['posted_date']
-                    if detail.get('location'):
-                        location_text = detail['location']
-                    
-                    # Fetch company profile/detail page for real company URL and size
-                    company_profile_url = detail.get('company_profile_url')
-                    if company_profile_url:
-                        profile_data = self._fetch_company_profile(company_profile_url)
-                        if profile_data:
-                            # Use real website URL from company profile
-                            if profile_data.get('website_url'):
-                                company_url = profile_data['website_url']
-                            # Use real company size from profile
-                            if profile_data.get('company_size'):
-                                detail['company_size'] = profile_data['company_size']
-                            # Update company name if different
-                            if profile_data.get('company_name'):
-                                company = profile_data['company_name']
-
-                    real_job_type = self.detect_job_type(job_title, location_text, description)
-                    if real_job_type == 'UNKNOWN':
-                        mapped = self._map_employment(detail.get('employment_type'), detail.get('workplace_type'))
-                        if mapped:
-                            real_job_type = mapped
-
-                    if not self.matches_job_type_filter(real_job_type):
-                        continue
-
-                    if not company:
-                        continue
-
-                    job_data = {
-                        'job_title': job_title,
-                        'company': company,
-                        'company_url': company_url,
-                        'company_size': detail.get('company_size', 'UNKNOWN'),
-                        'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
-                        'market': detail.get('market', 'USA'),
-                        'job_link': job_link,
-                        'posted_date': posted_date,
-                        'location': location_text,
-                        'job_description': description,
-                        'job_type': real_job_type,
-                        'salary_range': detail.get('salary_range', ''),
-                    }
-                    
-                    if self.should_include_job(posted_date):
-                        jobs.append(job_data)
-                except:
+                fields = _card_fields(card)
+                title_elem = fields.get('title')
+                if not title_elem:
+                    continue
+                
+                job_title = self.clean_text(title_elem.get_text())
+                
+                # ✅ STRICT KEYWORD MATCHING
+                # ✅ DYNAMIC KEYWORD FILTER: Check ALL keywords, not just current one
+                # No keywords = accept all
+                if self.keywords and not self.matches_any_keyword(job_title):
+                    continue
+                
+                company_elem = fields.get('company')
+                company = self.clean_text(company_elem.get_text() if company_elem else '')
+                
+                posted_elem = fields.get('posted')
+                posted_date = self.parse_date(posted_elem.get_text() if posted_elem else '')
+                location_elem = fields.get('location')
+                location_text = self.clean_text(location_elem.get_text() if location_elem else '')
+
+                link_elem = fields.get('link')
+                href = link_elem.get('href') if link_elem else None
+                job_link = urllib.parse.urljoin(self.base_url, href) if href else ''
+                
+                # The same posting often shows up under several keywords
+                if job_link and not self.is_new_link(job_link):
                     continue
+
+                candidates.append(JobRecord(
+                    job_title=job_title,
+                    company=company,
+                    job_link=job_link,
+                    posted_date=posted_date,
+                    location=location_text,
+                ))
+
+        # ✅ Job detail pages, fetched in parallel
+        details = self.fetch_details_concurrently([c.job_link for c in candidates if c.job_link])
+
+        # ✅ Company profiles are shared by many postings - fetch each distinct one once, in parallel
+        profile_urls = list(dict.fromkeys(
+            d['company_profile_url'] for d in details.values() if d.get('company_profile_url')
+        ))
+        profiles = self.fetch_details_concurrently(profile_urls, fetch=self._fetch_company_profile)
+
+        for candidate in candidates:
+            job_title = candidate.job_title
+            job_link = candidate.job_link
+            company = candidate.company
+            posted_date = candidate.posted_date
+            location_text = candidate.location
+
+            detail = details.get(job_link) or {}
+            description = detail.get('description', '')
+            company_url = detail.get('company_url')
+            
+            if detail.get('company'):
+                company = detail['company']
+            if detail.get('posted_date'):
+                posted_date = detail['posted_date']
+            if detail.get('location'):
+                location_text = detail['location']
+            
+            # Company profile/detail page gives the real company URL and size
+            company_profile_url = detail.get('company_profile_url')
+            profile_data = profiles.get(company_profile_url) if company_profile_url else None
+            if profile_data:
+                # Use real website URL from company profile
+                if profile_data.get('website_url'):
+                    company_url = profile_data['website_url']
+                # Use real company size from profile
+                if profile_data.get('company_size'):
+                    detail['company_size'] = profile_data['company_size']
+                # Update company name if different
+                if profile_data.get('company_name'):
+                    company = profile_data['company_name']
+
+            real_job_type = self.detect_job_type(job_title, location_text, description)
+            if real_job_type == 'UNKNOWN':
+                mapped = self._map_employment(detail.get('employment_type'), detail.get('workplace_type'))
+                if mapped:
+                    real_job_type = mapped
+
+            if not self.matches_job_type_filter(real_job_type):
+                continue
+
+            if not company:
+                continue
+
+            if not self.should_include_job(posted_date):
+                continue
+
+            record = candidate._replace(
+                company=company,
+                company_url=company_url,
+                company_size=detail.get('company_size', 'UNKNOWN'),
+                company_profile_url=company_profile_url,  # Pass for ScraperManager enrichment
+                market=detail.get('market', 'USA'),
+                posted_date=posted_date,
+                location=location_text,
+                job_description=description,
+                job_type=real_job_type,
+                salary_range=detail.get('salary_range', ''),
+            )
+            # ✅ Materialize to a dict only at the boundary
+            jobs.append(record._asdict())
         return jobs
 
     def _map_employment(self, employment: Optional[str], workplace: Optional[str]) -> Optional[str]:
-        employment_upper = (employment or '').upper()
-        workplace_upper = (workplace or '').upper()
+        employment_upper = employment.upper() if isinstance(employment, str) else ''
+        workplace_upper = workplace.upper() if isinstance(workplace, str) else ''
 
         if workplace_upper in {'REMOTE', 'TELECOMMUTE'}:
             return 'REMOTE'
@@ -149,90 +222,84 @@ class DiceScraper(BaseScraper):
         if not job_link:
             return detail
 
-        html = self.make_request(job_link, use_selenium=True)
-        if not html:
+        # ✅ JobPosting JSON-LD is in the server-rendered HTML - plain HTTP first,
+        # Selenium only when blocked or the block is missing (read straight from the raw HTML)
+        html = self.make_request_fast(job_link)
+        posting = extract_job_posting(html)
+        if not posting:
+            html = self.make_request(job_link, use_selenium=True)
+            posting = extract_job_posting(html)
+        if not posting:
             return detail
 
-        soup = self.parse_html(html)
+        description = posting.get('description')
+        if description:
+            detail['description'] = self.clean_text(description)
 
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.get_text(strip=True) or '{}')
-            except Exception:
-                continue
-            if not isinstance(data, dict) or data.get('@type') != 'JobPosting':
-                continue
+        date_posted = posting.get('dateposted')
+        if date_posted:
+            parsed = self.parse_date(date_posted)
+            if parsed:
+                detail['posted_date'] = parsed
 
-            description = data.get('description')
-            if description:
-                detail['description'] = self.clean_text(description)
-
-            date_posted = data.get('datePosted') or data.get('dateposted')
-            if date_posted:
-                parsed = self.parse_date(date_posted)
-                if parsed:
-                    detail['posted_date'] = parsed
-
-            hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-            if isinstance(hiring, dict):
-                name = hiring.get('name')
-                if name:
-                    detail['company'] = self.clean_text(name)
-                company_url = hiring.get('sameAs') or hiring.get('url')
-                if company_url:
-                    detail['company_url'] = company_url
-            
-            # Extract company profile URL from Dice job detail page using BaseScraper method
-            company_profile_url = self._extract_company_profile_url(soup)
-            if company_profile_url:
-                detail['company_profile_url'] = company_profile_url
-
-            job_location = data.get('jobLocation')
-            if isinstance(job_location, list):
-                job_location = job_location[0] if job_location else None
-            if isinstance(job_location, dict):
-                address = job_location.get('address')
-                if isinstance(address, dict):
-                    parts = [address.get('addressLocality'), address.get('addressRegion'), address.get('addressCountry')]
-                    loc = ', '.join([self.clean_text(p) for p in parts if p])
-                    if loc:
-                        detail['location'] = loc
-                        detail['market'] = 'USA' if 'UNITED STATES' in loc.upper() or 'USA' in loc.upper() else 'OTHER'
-
-            employment = data.get('employmentType')
-            if isinstance(employment, list):
-                employment = employment[0] if employment else None
-            detail['employment_type'] = employment
-
-            workplace = data.get('jobLocationType') or data.get('workplaceType')
-            if isinstance(workplace, list):
-                workplace = workplace[0]
-            detail['workplace_type'] = workplace
-
-            salary = data.get('baseSalary')
-            if isinstance(salary, dict):
-                value = salary.get('value', {})
-                min_value = value.get('minValue')
-                max_value = value.get('maxValue')
-                unit = value.get('unitText')
-                if min_value and max_value:
-                    detail['salary_range'] = f"{min_value}-{max_value}{' ' + unit if unit else ''}"
-
-            break
+        name, company_url, parts, (min_value, max_value, unit) = _posting_fields(posting)
+
+        if name:
+            detail['company'] = self.clean_text(name)
+        if company_url:
+            detail['company_url'] = company_url
+        
+        # Extract company profile URL from Dice job detail page using BaseScraper method
+        # (only the links are built into a soup)
+        soup = self.parse_html(html, parse_only=LINK_STRAINER)
+        company_profile_url = self._extract_company_profile_url(soup)
+        if company_profile_url:
+            detail['company_profile_url'] = company_profile_url
+
+        loc = ', '.join([self.clean_text(p) for p in parts if p])
+        if loc:
+            detail['location'] = loc
+            detail['market'] = 'USA' if 'UNITED STATES' in loc.upper() or 'USA' in loc.upper() else 'OTHER'
+
+        employment = posting.get('employmenttype')
+        if isinstance(employment, list):
+            employment = employment[0] if employment else None
+        detail['employment_type'] = employment
+
+        workplace = posting.get('joblocationtype') or posting.get('workplacetype')
+        if isinstance(workplace, list):
+            workplace = workplace[0]
+        detail['workplace_type'] = workplace
+
+        if min_value and max_value:
+            detail['salary_range'] = f"{min_value}-{max_value}{' ' + unit if unit else ''}"
 
         return detail
 
     def _fetch_company_profile(self, profile_url: str) -> Dict[str, Optional[str]]:
         """Fetch Dice company profile to get real company website URL and size"""
-        profile_data = {}
         if not profile_url:
+            return {}
+        
+        # ✅ Plain HTTP over the shared keep-alive session first - Selenium only when blocked
+        # or the page carries neither website nor size (client-side rendered)
+        profile_data = self._parse_company_profile(self.make_request_fast(profile_url), profile_url)
+        if not (profile_data.get('website_url') or profile_data.get('company_size')):
+            try:
+                html = self.make_request(profile_url, use_selenium=True)
+            except Exception as e:
+                logger.debug(f"Error fetching Dice company profile from {profile_url}: {e}")
+                return profile_data
+            profile_data = self._parse_company_profile(html, profile_url) or profile_data
+        return profile_data
+
+    def _parse_company_profile(self, html: Optional[str], profile_url: str) -> Dict[str, Optional[str]]:
+        """Website URL, company size and name from a Dice company profile page"""
+        profile_data = {}
+        if not html:
             return profile_data
         
         try:
-            html = self.make_request(profile_url, use_selenium=True)
-            if not html:
-                return profile_data
-            
             soup = self.parse_html(html)
             
             # Extract company website URL from Dice company profile
@@ -251,28 +318,14 @@ class DiceScraper(BaseScraper):
                         logger.info(f"Found website URL from Dice company profile: {href}")
                         break
             
-            # Extract company size from Dice company profile
-            all_text = soup.get_text()
-            size_patterns = [
-                r'company\s*size[:\s]+(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                r'(\d{1,3}(?:,\d{3})*)\s*-\s*(\d{1,3}(?:,\d{3})*)\s*employees?',
-                r'(\d{1,3}(?:,\d{3})*)\s*employees?',
-            ]
-            
-            for pattern in size_patterns:
-                match = re.search(pattern, all_text, re.IGNORECASE)
-                if match:
-                    if len(match.groups()) == 2:
-                        min_val = int(match.group(1).replace(',', ''))
-                        max_val = int(match.group(2).replace(',', ''))
-                        profile_data['company_size'] = self._parse_company_size_from_range(min_val, max_val)
-                        logger.info(f"Found company size from Dice profile: {min_val}-{max_val}")
-                        break
-                    else:
-                        count = int(match.group(1).replace(',', ''))
-                        profile_data['company_size'] = self._parse_company_size_from_count(count)
-                        logger.info(f"Found company size from Dice profile: {count}")
-                        break
+            # Extract company size from Dice company profile - the overview block first,
+            # the whole page text only when that block is missing or has no size
+            info = _COMPANY_INFO_SELECTOR.select_one(soup)
+            company_size = self._company_size_from_text(info.get_text()) if info is not None else None
+            if company_size is None:
+                company_size = self._company_size_from_text(soup.get_text())
+            if company_size:
+                profile_data['company_size'] = company_size
             
             # Extract company name from profile
             company_name_elem = soup.find('h1') or soup.find('h2', class_='company-name')
@@ -282,10 +335,17 @@ class DiceScraper(BaseScraper):
                     profile_data['company_name'] = company_name
             
         except Exception as e:
-            logger.debug(f"Error fetching Dice company profile from {profile_url}: {e}")
+            logger.debug(f"Error parsing Dice company profile from {profile_url}: {e}")
         
         return profile_data
 
+    def _company_size_from_text(self, text: str) -> Optional[str]:
+        """Size category from the employee counts/ranges in profile text (see company_size_from_text)"""
+        company_size = company_size_from_text(text)
+        if company_size:
+            logger.info(f"Found company size from Dice profile: {company_size}")
+        return company_size
+
     def _parse_company_size_from_count(self, count: any) -> str:
         """Convert employee count to size category"""
         try:
@@ -1,14 +1,34 @@
 """Dynamite Jobs Scraper - MULTI-APPROACH: Tries multiple methods to fetch maximum jobs"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, extract_job_posting, infer_company_from_url, lower_keys
 from ..utils.multi_approach_scraper import MultiApproachExtractor
-import json
 import logging
 import re
+import soupsieve
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+# Job card containers - fused into one selector (page walked once, each card once, document order)
+_JOB_CARD_SELECTOR = soupsieve.compile(', '.join([
+    'div.job-listing',
+    'article.job',
+    'div.job-card',
+    'div.job-item',
+    'li.job',
+]))
+
+# Looser matches, only used when no card matched above
+_FALLBACK_CARD_SELECTOR = soupsieve.compile(', '.join([
+    'div[class*="job"]',
+    'article[class*="job"]',
+    'li[class*="job"]',
+    '[data-job-id]',
+    '[data-job]',
+]))
+
+_JOB_LINK_RE = re.compile(r'/job|/position|/career|/vacancy', re.I)
+
 class DynamiteJobsScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -27,49 +47,32 @@ class DynamiteJobsScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            # Try with Selenium first since it requires JavaScript
-            html = self.make_request(url, use_selenium=True)
+        candidates: List[JobRecord] = []
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+        
+        # ✅ Search pages for all keywords load in parallel (each worker checks out its own pooled driver)
+        pages = self.fetch_search_pages(search_urls)
+        
+        for keyword, html in zip(self.keywords, pages):
             if not html:
                 continue
             soup = self.parse_html(html)
-            # Try multiple selectors to get maximum jobs - need to check each one
-            job_cards = []
-            selectors_to_try = [
-                ('div', {'class': 'job-listing'}),
-                ('article', {'class': 'job'}),
-                ('div', {'class': 'job-card'}),
-                ('div', {'class': 'job-item'}),
-                ('li', {'class': 'job'}),
-                ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-                ('article', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ]
-            
-            for tag, attrs in selectors_to_try:
-                found = soup.find_all(tag, attrs)
-                if found:
-                    job_cards.extend(found)
-                    logger.debug(f"Dynamite Jobs: Found {len(found)} cards with {tag} {attrs}")
+            # Try multiple selectors to get maximum jobs (one pass over the page, no duplicate cards)
+            job_cards = _JOB_CARD_SELECTOR.select(soup)
+            if job_cards:
+                logger.debug(f"Dynamite Jobs: Found {len(job_cards)} cards with job card selector")
             
             # Also try CSS selectors
             if not job_cards:
-                css_selectors = [
-                    'div[class*="job"]',
-                    'article[class*="job"]',
-                    'li[class*="job"]',
-                    '[data-job-id]',
-                    '[data-job]',
-                ]
-                for selector in css_selectors:
-                    found = soup.select(selector)
-                    if found:
-                        job_cards.extend(found)
-                        logger.debug(f"Dynamite Jobs: Found {len(found)} cards with CSS selector {selector}")
+                job_cards = _FALLBACK_CARD_SELECTOR.select(soup)
+                if job_cards:
+                    logger.debug(f"Dynamite Jobs: Found {len(job_cards)} cards with fallback CSS selector")
             
             # Try finding any links that look like job links
             if not job_cards:
-                job_links = soup.find_all('a', href=re.compile(r'/job|/position|/career|/vacancy', re.I))
+                job_links = soup.find_all('a', href=_JOB_LINK_RE)
                 for link in job_links:
                     parent = link.find_parent(['div', 'article', 'li'])
                     if parent and parent not in job_cards:
@@ -95,13 +98,18 @@ class DynamiteJobsScraper(BaseScraper):
                     if not title_elem:
                         continue
                     
+                    job_title = self.clean_text(title_elem.get_text())
+                    if not job_title:
+                        continue
+                    
                     job_link = ''
                     link_elem = card.find('a') or title_elem.find('a') if title_elem else None
                     if link_elem and link_elem.get('href'):
-                        href = link_elem['href']
-                        job_link = urljoin(self.base_url, href) if not href.startswith('http') else href
+                        # absolute, root-, protocol- and path-relative hrefs (dot segments resolved)
+                        job_link = urljoin(self.base_url, link_elem['href'])
                     
-                    if not job_link:
+                    # The same posting often shows up under several keywords
+                    if not job_link or not self.is_new_link(job_link):
                         continue
                     
                     # Extract from card
@@ -124,73 +132,74 @@ class DynamiteJobsScraper(BaseScraper):
                         date_str = date_elem.get('datetime') or date_elem.get_text()
                         posted_date = self.parse_date(date_str)
                     
-                    # Fetch job detail page to get ALL real data
-                    company_profile_url = None
-                    company_url = None
-                    company_size = ''
-                    job_description = ''
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            job_description = detail.get('description', '')
-                            if detail.get('posted_date') and not posted_date:
-                                posted_date = detail['posted_date']
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size'):
-                                company_size = detail['company_size']
-                            if detail.get('location') and location == 'Remote':
-                                location = detail['location']
-                    except Exception as e:
-                        logger.debug(f"Dynamite Jobs: Error fetching job detail for {job_link}: {e}")
-                    
-                    # If still no company, infer from job link
-                    if not company or company.lower() in ['unknown', 'company not listed', '']:
-                        try:
-                            from urllib.parse import urlparse
-                            domain = urlparse(job_link).netloc
-                            if domain:
-                                company = domain.replace('www.', '').split('.')[0].title()
-                        except:
-                            company = 'Company Not Listed'
-                    
-                    job_title = self.clean_text(title_elem.get_text())
-                    if not job_title:
-                        continue
-                    
-                    detected_type = self.detect_job_type(job_title, location, job_description)
-                    if detected_type == 'UNKNOWN' and self.job_type != 'ALL':
-                        detected_type = self.job_type
-                    
-                    # ✅ REMOVED STRICT FILTERS - Let all jobs through
-                    # Only check time filter if date is available
-                    if posted_date and not self.should_include_job(posted_date):
-                        continue
-                    # Only filter if job type filter is very specific (not ALL)
-                    if self.job_type != 'ALL' and not self.matches_job_type_filter(detected_type):
-                        continue
-                    
-                    # ONLY require job_title (company can be inferred)
-                    if job_title:
-                        job_data = {
-                            'job_title': job_title,
-                            'company': company if company else 'Company Not Listed',
-                            'company_url': company_url or '',
-                            'company_size': company_size or '',  # Empty string instead of "UNKNOWN"
-                            'company_profile_url': company_profile_url or None,
-                            'market': 'USA',
-                            'job_link': job_link,
-                            'posted_date': posted_date,
-                            'location': location or '',
-                            'job_description': job_description or '',
-                            'job_type': detected_type,
-                        }
-                        jobs.append(job_data)
+                    candidates.append(JobRecord(
+                        job_title=job_title,
+                        company=company,
+                        job_link=job_link,
+                        posted_date=posted_date,
+                        location=location,
+                    ))
                 except Exception as e:
                     logger.debug(f"Dynamite Jobs: Error parsing job card: {e}")
                     continue
+        
+        # ✅ Job detail pages for every keyword, fetched in parallel (each unique link once)
+        details = self.fetch_details_concurrently(list(dict.fromkeys(c.job_link for c in candidates)))
+        
+        for candidate in candidates:
+            job_title = candidate.job_title
+            job_link = candidate.job_link
+            company = candidate.company
+            location = candidate.location
+            posted_date = candidate.posted_date
+            
+            # Job detail page gives ALL real data
+            company_profile_url = None
+            company_url = None
+            company_size = ''
+            job_description = ''
+            detail = details.get(job_link)
+            if detail:
+                job_description = detail.get('description', '')
+                if detail.get('posted_date') and not posted_date:
+                    posted_date = detail['posted_date']
+                if detail.get('company') and not company:
+                    company = detail['company']
+                company_url = detail.get('company_url')
+                company_profile_url = detail.get('company_profile_url')
+                if detail.get('company_size'):
+                    company_size = detail['company_size']
+                if detail.get('location') and location == 'Remote':
+                    location = detail['location']
+            
+            # If still no company, infer from job link
+            if not company or company.lower() in ['unknown', 'company not listed', '']:
+                company = infer_company_from_url(job_link)
+            
+            detected_type = self.detect_job_type(job_title, location, job_description)
+            if detected_type == 'UNKNOWN' and self.job_type != 'ALL':
+                detected_type = self.job_type
+            
+            # ✅ REMOVED STRICT FILTERS - Let all jobs through
+            # Only check time filter if date is available
+            if posted_date and not self.should_include_job(posted_date):
+                continue
+            # Only filter if job type filter is very specific (not ALL)
+            if self.job_type != 'ALL' and not self.matches_job_type_filter(detected_type):
+                continue
+            
+            # ONLY require job_title (company can be inferred)
+            jobs.append(candidate._replace(
+                company=company if company else 'Company Not Listed',
+                company_url=company_url or '',
+                company_size=company_size or '',  # Empty string instead of "UNKNOWN"
+                company_profile_url=company_profile_url or None,
+                market='USA',
+                posted_date=posted_date,
+                location=location or '',
+                job_description=job_description or '',
+                job_type=detected_type,
+            )._asdict())
         return jobs
     
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
@@ -211,30 +220,24 @@ class DynamiteJobsScraper(BaseScraper):
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+            # Extract company URL from JSON-LD (first JobPosting block only, read from the raw HTML)
+            posting = extract_job_posting(html)
+            if posting:
+                hiring = lower_keys(posting.get('hiringorganization'))
+                company_url = hiring.get('sameas') or hiring.get('url')
+                if company_url:
+                    detail['company_url'] = company_url
+                name = hiring.get('name')
+                if name:
+                    detail['company'] = self.clean_text(name)
+                description = posting.get('description')
+                if description:
+                    detail['description'] = self.clean_text(description)
+                date_posted = posting.get('dateposted')
+                if date_posted:
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
             
             # Extract location from job detail page
             location_elem = soup.find('span', class_='location') or \
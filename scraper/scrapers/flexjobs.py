@@ -1,12 +1,50 @@
 """FlexJobs Scraper"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
-import json
+from ..utils.base_scraper import BaseScraper, JobRecord, card_strainer, extract_job_posting, lower_keys
 import logging
+import soupsieve
+from bs4 import SoupStrainer
 from urllib.parse import urljoin
 
 logger = logging.getLogger(__name__)
 
+
+# ✅ Search pages: only build li/div/article subtrees whose class mentions "job" (every card selector below)
+_CARD_STRAINER = card_strainer(('li', 'div', 'article'), substring='job')
+
+_DETAIL_CLASSES = {
+    'span': {'location', 'date'},
+    'div': {'location', 'date', 'description', 'job-description'},
+    'p': {'location'},
+}
+
+
+def _is_detail_node(name: str, attrs: Dict) -> bool:
+    if name in ('a', 'time'):
+        return True
+    if name == 'div' and attrs.get('id') == 'job-description':
+        return True
+    wanted = _DETAIL_CLASSES.get(name)
+    if not wanted:
+        return False
+    classes = attrs.get('class') or ''
+    if isinstance(classes, str):
+        classes = classes.split()
+    return not wanted.isdisjoint(classes)
+
+
+# ✅ Detail pages: links (company profile URL) plus the location/date/description elements read below;
+# JSON-LD comes from the raw HTML, so <script> blocks and the rest of the page are never built
+_DETAIL_STRAINER = SoupStrainer(_is_detail_node)
+
+# Job card selectors - the first one that finds cards wins
+_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'li.job',
+    'div.job',
+    'article.job',
+    'li[class*="job"], div[class*="job"]',
+))
+
 class FlexJobsScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -25,17 +63,24 @@ class FlexJobsScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            html = self.make_request(url, use_selenium=True)
+        candidates: List[JobRecord] = []
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+        
+        # ✅ Search pages for all keywords load in parallel (each worker checks out its own pooled driver)
+        pages = self.fetch_search_pages(search_urls)
+        
+        for html in pages:
             if not html:
                 continue
-            soup = self.parse_html(html)
+            soup = self.parse_html(html, parse_only=_CARD_STRAINER)
             # Try multiple selectors to get maximum jobs
-            job_cards = soup.find_all('li', class_='job') or \
-                       soup.find_all('div', class_='job') or \
-                       soup.find_all('article', class_='job') or \
-                       soup.select('li[class*="job"], div[class*="job"]')
+            job_cards = []
+            for selector in _CARD_SELECTORS:
+                job_cards = selector.select(soup)
+                if job_cards:
+                    break
             
             for card in job_cards:
                 try:
@@ -46,15 +91,16 @@ class FlexJobsScraper(BaseScraper):
                     if not title_elem:
                         continue
                     
-                    job_link = ''
-                    if title_elem.name == 'a' and title_elem.get('href'):
-                        href = title_elem['href']
-                        job_link = urljoin(self.base_url, href) if not href.startswith('http') else href
-                    elif card.find('a') and card.find('a').get('href'):
-                        href = card.find('a')['href']
-                        job_link = urljoin(self.base_url, href) if not href.startswith('http') else href
+                    job_title = self.clean_text(title_elem.get_text())
+                    if not job_title:
+                        continue
+                    
+                    link_elem = title_elem if title_elem.name == 'a' and title_elem.get('href') else card.find('a')
+                    href = link_elem.get('href') if link_elem else None
+                    job_link = (urljoin(self.base_url, href) if not href.startswith('http') else href) if href else ''
                     
-                    if not job_link:
+                    # The same posting often shows up under several keywords
+                    if not job_link or not self.is_new_link(job_link):
                         continue
                     
                     # Extract from card
@@ -77,58 +123,68 @@ class FlexJobsScraper(BaseScraper):
                         date_str = date_elem.get('datetime') or date_elem.get_text()
                         posted_date = self.parse_date(date_str)
                     
-                    # Fetch job detail page to get ALL real data
-                    company_profile_url = None
-                    company_url = None
-                    company_size = ''
-                    job_description = ''
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            job_description = detail.get('description', '')
-                            if detail.get('posted_date') and not posted_date:
-                                posted_date = detail['posted_date']
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size'):
-                                company_size = detail['company_size']
-                            if detail.get('location') and location == 'Remote':
-                                location = detail['location']
-                    except Exception as e:
-                        logger.debug(f"FlexJobs: Error fetching job detail for {job_link}: {e}")
-                    
-                    # Only add if we have real data
-                    if not company or not company.strip():
-                        continue
-                    
-                    job_title = self.clean_text(title_elem.get_text())
-                    if not job_title:
-                        continue
-                    
-                    detected_type = self.detect_job_type(job_title, location, job_description)
-                    
-                    job_data = {
-                        'job_title': job_title,
-                        'company': company,
-                        'company_url': company_url or '',
-                        'company_size': company_size or '',
-                        'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
-                        'market': 'USA',
-                        'job_link': job_link,
-                        'posted_date': posted_date,
-                        'location': location or '',
-                        'job_description': job_description or '',
-                        'job_type': detected_type if detected_type != 'UNKNOWN' else (self.job_type if self.job_type != 'ALL' else ''),
-                    }
-                    
-                    if self.should_include_job(job_data['posted_date']):
-                        if self.matches_job_type_filter(detected_type):
-                            jobs.append(job_data)
+                    candidates.append(JobRecord(
+                        job_title=job_title,
+                        company=company,
+                        job_link=job_link,
+                        posted_date=posted_date,
+                        location=location,
+                    ))
                 except Exception as e:
                     logger.debug(f"FlexJobs: Error parsing job card: {e}")
                     continue
+        
+        # ✅ Job detail pages for every keyword, fetched in parallel (each unique link once)
+        details = self.fetch_details_concurrently(list(dict.fromkeys(c.job_link for c in candidates)))
+        
+        for candidate in candidates:
+            job_title = candidate.job_title
+            job_link = candidate.job_link
+            company = candidate.company
+            location = candidate.location
+            posted_date = candidate.posted_date
+            
+            # Job detail page gives ALL real data
+            company_profile_url = None
+            company_url = None
+            company_size = ''
+            job_description = ''
+            detail = details.get(job_link)
+            if detail:
+                job_description = detail.get('description', '')
+                if detail.get('posted_date') and not posted_date:
+                    posted_date = detail['posted_date']
+                if detail.get('company') and not company:
+                    company = detail['company']
+                company_url = detail.get('company_url')
+                company_profile_url = detail.get('company_profile_url')
+                if detail.get('company_size'):
+                    company_size = detail['company_size']
+                if detail.get('location') and location == 'Remote':
+                    location = detail['location']
+            
+            # Only add if we have real data
+            if not company or not company.strip():
+                continue
+            
+            detected_type = self.detect_job_type(job_title, location, job_description)
+            
+            if not self.should_include_job(posted_date):
+                continue
+            if not self.matches_job_type_filter(detected_type):
+                continue
+            
+            jobs.append(candidate._replace(
+                company=company,
+                company_url=company_url or '',
+                company_size=company_size or '',
+                company_profile_url=company_profile_url,  # Pass for ScraperManager enrichment
+                market='USA',
+                posted_date=posted_date,
+                location=location or '',
+                job_description=job_description or '',
+                job_type=detected_type if detected_type != 'UNKNOWN' else (self.job_type if self.job_type != 'ALL' else ''),
+            )._asdict())
         return jobs
     
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
@@ -142,37 +198,31 @@ class FlexJobsScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            soup = self.parse_html(html, parse_only=_DETAIL_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+            # Extract company URL from JSON-LD or HTML (read from the raw HTML, non-JobPosting blocks never decoded)
+            posting = extract_job_posting(html)
+            if posting:
+                hiring = lower_keys(posting.get('hiringorganization'))
+                company_url = hiring.get('sameas') or hiring.get('url')
+                if company_url:
+                    detail['company_url'] = company_url
+                name = hiring.get('name')
+                if name:
+                    detail['company'] = self.clean_text(name)
+                description = posting.get('description')
+                if description:
+                    detail['description'] = self.clean_text(description)
+                date_posted = posting.get('dateposted')
+                if date_posted:
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
             
             # Extract location from job detail page
             location_elem = soup.find('span', class_='location') or \
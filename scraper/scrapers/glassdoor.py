@@ -1,14 +1,34 @@
 """Glassdoor Scraper - MULTI-APPROACH: Tries multiple methods to fetch maximum jobs"""
 from typing import List, Dict, Optional
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, LINK_STRAINER, LISTING_STRAINER, extract_job_posting, infer_company_from_url, lower_keys
 from ..utils.multi_approach_scraper import MultiApproachExtractor
 import urllib.parse
-import json
 import logging
 import re
+import soupsieve
 
 logger = logging.getLogger(__name__)
 
+# ✅ Card selectors compiled once - every one that finds cards contributes
+_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'li.react-job-listing',
+    'div.react-job-listing',
+    'li.job',
+    'div.job',
+    'article.job',
+))
+
+# Looser CSS fallbacks, only when none of the above matched
+_FALLBACK_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'li[class*="job"]',
+    'div[class*="job"]',
+    'article[class*="job"]',
+    '[data-job-id]',
+    '[data-job]',
+))
+
+_JOB_LINK_RE = re.compile(r'/job|/position|/career|/vacancy', re.I)
+
 class GlassdoorScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -23,53 +43,42 @@ class GlassdoorScraper(BaseScraper):
         return True
     
     def build_search_url(self, keyword: str) -> str:
-        params = {'keyword': keyword}
-        return f"{self.base_url}/Job/jobs.htm?{urllib.parse.urlencode(params)}"
+        return f"{self.base_url}/Job/jobs.htm?keyword={urllib.parse.quote_plus(keyword)}"
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            html = self.make_request(url, use_selenium=True)
+        candidates: List[JobRecord] = []
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+        
+        # ✅ Search pages for all keywords load in parallel (each worker checks out its own pooled driver)
+        pages = self.fetch_search_pages(search_urls)
+        
+        for keyword, html in zip(self.keywords, pages):
             if not html:
                 continue
-            soup = self.parse_html(html)
+            # Only the card containers and links are built (LISTING_STRAINER)
+            soup = self.parse_html(html, parse_only=LISTING_STRAINER)
             # Try multiple selectors to get maximum jobs
             job_cards = []
-            selectors_to_try = [
-                ('li', {'class': 'react-job-listing'}),
-                ('div', {'class': 'react-job-listing'}),
-                ('li', {'class': 'job'}),
-                ('div', {'class': 'job'}),
-                ('article', {'class': 'job'}),
-                ('li', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-                ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ]
-            
-            for tag, attrs in selectors_to_try:
-                found = soup.find_all(tag, attrs)
+            for selector in _CARD_SELECTORS:
+                found = selector.select(soup)
                 if found:
                     job_cards.extend(found)
-                    logger.debug(f"Glassdoor: Found {len(found)} cards with {tag} {attrs}")
+                    logger.debug(f"Glassdoor: Found {len(found)} cards with {selector.pattern}")
             
             # Also try CSS selectors
             if not job_cards:
-                css_selectors = [
-                    'li[class*="job"]',
-                    'div[class*="job"]',
-                    'article[class*="job"]',
-                    '[data-job-id]',
-                    '[data-job]',
-                ]
-                for selector in css_selectors:
-                    found = soup.select(selector)
+                for selector in _FALLBACK_CARD_SELECTORS:
+                    found = selector.select(soup)
                     if found:
                         job_cards.extend(found)
-                        logger.debug(f"Glassdoor: Found {len(found)} cards with CSS selector {selector}")
+                        logger.debug(f"Glassdoor: Found {len(found)} cards with CSS selector {selector.pattern}")
             
             # Try finding any links that look like job links
             if not job_cards:
-                job_links = soup.find_all('a', href=re.compile(r'/job|/position|/career|/vacancy', re.I))
+                job_links = soup.find_all('a', href=_JOB_LINK_RE)
                 for link in job_links:
                     parent = link.find_parent(['li', 'div', 'article'])
                     if parent and parent not in job_cards:
@@ -94,78 +103,87 @@ class GlassdoorScraper(BaseScraper):
                     title_elem = card.find('a', class_='job-title')
                     if not title_elem:
                         continue
-                    job_link = self.base_url + title_elem['href'] if title_elem else ''
-                    if not job_link:
+                    job_link = self.base_url + title_elem['href']
+                    # The same posting often shows up under several keywords
+                    if not self.is_new_link(job_link):
                         continue
                     
-                    company = self.clean_text(card.find('div', class_='employer-name').get_text() if card.find('div', class_='employer-name') else '') or ''
-                    posted_date = self.parse_date(card.find('span', class_='job-posted').get_text() if card.find('span', class_='job-posted') else '')
-                    location = self.clean_text(card.find('span', class_='job-location').get_text() if card.find('span', class_='job-location') else '') or ''
-                    
-                    # ALWAYS fetch job detail page to get REAL data (NO "Unknown")
-                    company_profile_url = None
-                    company_url = None
-                    company_size = ''
-                    job_description = ''
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            job_description = detail.get('description', '') or detail.get('job_description', '')
-                            if detail.get('posted_date') and not posted_date:
-                                posted_date = detail['posted_date']
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size') and detail['company_size'] not in ['UNKNOWN', 'Unknown', '']:
-                                company_size = detail['company_size']
-                            if detail.get('location') and not location:
-                                location = detail['location']
-                    except Exception as e:
-                        logger.debug(f"Glassdoor: Error fetching job detail for {job_link}: {e}")
-                    
-                    # If still no company, infer from job link
-                    if not company or company.lower() in ['unknown', 'company not listed', '']:
-                        try:
-                            from urllib.parse import urlparse
-                            domain = urlparse(job_link).netloc
-                            if domain:
-                                company = domain.replace('www.', '').split('.')[0].title()
-                        except:
-                            company = 'Company Not Listed'
-                    
-                    # ✅ REMOVED STRICT FILTERS - Let all jobs through
-                    # Detect job type
-                    job_title = self.clean_text(title_elem.get_text())
-                    detected_type = self.detect_job_type(job_title, location, job_description)
-                    if detected_type == 'UNKNOWN' and self.job_type != 'ALL':
-                        detected_type = self.job_type
-                    
-                    # Only check time filter if date is available
-                    if posted_date and not self.should_include_job(posted_date):
-                        continue
-                    # Only filter if job type filter is very specific (not ALL)
-                    if self.job_type != 'ALL' and not self.matches_job_type_filter(detected_type):
-                        continue
+                    company_elem = card.find('div', class_='employer-name')
+                    company = self.clean_text(company_elem.get_text()) if company_elem else ''
+                    posted_elem = card.find('span', class_='job-posted')
+                    posted_date = self.parse_date(posted_elem.get_text() if posted_elem else '')
+                    location_elem = card.find('span', class_='job-location')
+                    location = self.clean_text(location_elem.get_text()) if location_elem else ''
                     
-                    # ONLY require job_title (company can be inferred)
-                    if job_title:
-                        job_data = {
-                            'job_title': job_title,
-                            'company': company if company else 'Company Not Listed',
-                            'company_url': company_url or '',
-                            'company_size': company_size or '',  # Empty string instead of "UNKNOWN"
-                            'company_profile_url': company_profile_url or None,
-                            'market': 'USA',
-                            'job_link': job_link,
-                            'posted_date': posted_date,
-                            'location': location if location else '',
-                            'job_description': job_description if job_description else '',
-                            'job_type': detected_type,
-                        }
-                        jobs.append(job_data)
-                except:
+                    candidates.append(JobRecord(
+                        job_title=self.clean_text(title_elem.get_text()),
+                        company=company,
+                        job_link=job_link,
+                        posted_date=posted_date,
+                        location=location,
+                    ))
+                except (AttributeError, KeyError, TypeError):
                     continue
+        
+        # ✅ ALWAYS fetch job detail pages to get REAL data (NO "Unknown") - all keywords in parallel,
+        # each unique link once
+        details = self.fetch_details_concurrently(list(dict.fromkeys(c.job_link for c in candidates)))
+        
+        for candidate in candidates:
+            job_title = candidate.job_title
+            job_link = candidate.job_link
+            company = candidate.company
+            location = candidate.location
+            posted_date = candidate.posted_date
+            
+            company_profile_url = None
+            company_url = None
+            company_size = ''
+            job_description = ''
+            detail = details.get(job_link)
+            if detail:
+                job_description = detail.get('description', '') or detail.get('job_description', '')
+                if detail.get('posted_date') and not posted_date:
+                    posted_date = detail['posted_date']
+                if detail.get('company') and not company:
+                    company = detail['company']
+                company_url = detail.get('company_url')
+                company_profile_url = detail.get('company_profile_url')
+                if detail.get('company_size') and detail['company_size'] not in ['UNKNOWN', 'Unknown', '']:
+                    company_size = detail['company_size']
+                if detail.get('location') and not location:
+                    location = detail['location']
+            
+            # If still no company, infer from job link
+            if not company or company.lower() in ['unknown', 'company not listed', '']:
+                company = infer_company_from_url(job_link)
+            
+            # ✅ REMOVED STRICT FILTERS - Let all jobs through
+            # Detect job type
+            detected_type = self.detect_job_type(job_title, location, job_description)
+            if detected_type == 'UNKNOWN' and self.job_type != 'ALL':
+                detected_type = self.job_type
+            
+            # Only check time filter if date is available
+            if posted_date and not self.should_include_job(posted_date):
+                continue
+            # Only filter if job type filter is very specific (not ALL)
+            if self.job_type != 'ALL' and not self.matches_job_type_filter(detected_type):
+                continue
+            
+            # ONLY require job_title (company can be inferred)
+            if job_title:
+                jobs.append(candidate._replace(
+                    company=company if company else 'Company Not Listed',
+                    company_url=company_url or '',
+                    company_size=company_size or '',  # Empty string instead of "UNKNOWN"
+                    company_profile_url=company_profile_url or None,
+                    market='USA',
+                    posted_date=posted_date,
+                    location=location if location else '',
+                    job_description=job_description if job_description else '',
+                    job_type=detected_type,
+                )._asdict())
         return jobs
     
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
@@ -179,37 +197,32 @@ class GlassdoorScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            # Only the profile link scan needs the DOM - JSON-LD is read from the raw HTML
+            soup = self.parse_html(html, parse_only=LINK_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+            # Extract company URL from JSON-LD or HTML (read from the raw HTML, non-JobPosting blocks never decoded)
+            posting = extract_job_posting(html)
+            if posting:
+                hiring = lower_keys(posting.get('hiringorganization'))
+                company_url = hiring.get('sameas') or hiring.get('url')
+                if company_url:
+                    detail['company_url'] = company_url
+                name = hiring.get('name')
+                if name:
+                    detail['company'] = self.clean_text(name)
+                description = posting.get('description')
+                if description:
+                    detail['description'] = self.clean_text(description)
+                date_posted = posting.get('dateposted')
+                if date_posted:
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
         except Exception as e:
             logger.debug(f"Glassdoor: Error fetching job detail: {e}")
         
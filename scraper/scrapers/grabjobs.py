@@ -1,12 +1,81 @@
 """Grabjobs Scraper"""
+from functools import lru_cache
 from typing import List, Dict, Optional
 from urllib.parse import quote_plus, urljoin
-from ..utils.base_scraper import BaseScraper
+from ..utils.base_scraper import BaseScraper, JobRecord, LINK_STRAINER, card_strainer, extract_job_posting, lower_keys
 import logging
-import json
+import re
+import soupsieve
 
 logger = logging.getLogger(__name__)
 
+
+# ✅ Search pages: only build div/article subtrees whose class mentions "job" (every card selector below)
+_CARD_STRAINER = card_strainer(('div', 'article'), substring='job')
+
+# Job card selectors - the first one that finds cards wins
+_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'div.job-card',
+    'article.job',
+    'div.job-item',
+    'div[class*="job"], article[class*="job"]',
+))
+
+def _selector_group(*patterns):
+    """(union of all patterns, each pattern compiled on its own) - see _first_matches()"""
+    return soupsieve.compile(', '.join(patterns)), tuple(soupsieve.compile(p) for p in patterns)
+
+
+def _first_matches(card, group):
+    """
+    Each selector's first match in the card, in selector priority order - the same elements
+    a select_one() per selector would return, from a single walk of the card with the union
+    """
+    union, selectors = group
+    matches = union.select(card)
+    for selector in selectors:
+        for elem in matches:
+            if selector.match(elem):
+                yield elem
+                break
+
+
+# ✅ Card field selectors compiled once, tried in priority order by the _extract_* helpers
+_COMPANY_SELECTORS = _selector_group(
+    '.company', '.company-name', '[class*="company"]',
+    'span.company', 'div.company', 'a.company',
+    '.employer', '.employer-name', '[data-company]',
+)
+_LOCATION_SELECTORS = _selector_group(
+    '.location', '.job-location', '[class*="location"]',
+    'span.location', 'div.location', '.city', '.place',
+    '.address', '.where', '[data-location]',
+)
+_DATE_SELECTORS = _selector_group(
+    '.date', '.posted-date', '[class*="date"]',
+    'time', '[datetime]', '.time-ago', '.posted',
+    '.published', '.publish-date', '[data-date]',
+)
+_DESCRIPTION_SELECTORS = _selector_group(
+    '.description', '.job-description', '[class*="description"]',
+    '.summary', '.snippet', '.excerpt', 'p',
+)
+
+_UK_MARKET_RE = re.compile(r'UNITED KINGDOM|LONDON|\bUK\b', re.IGNORECASE)
+_USA_MARKET_RE = re.compile(r'UNITED STATES|\b(?:USA|NY|CA|TX|FL)\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _market_for_location(location: str) -> str:
+    """Market for a card location (memoized - the same locations repeat across cards and keywords)"""
+    if not location:
+        return 'OTHER'
+    if _UK_MARKET_RE.search(location):
+        return 'UK'
+    if _USA_MARKET_RE.search(location):
+        return 'USA'
+    return 'OTHER'
+
 class GrabJobsScraper(BaseScraper):
     @property
     def portal_name(self) -> str:
@@ -22,13 +91,7 @@ class GrabJobsScraper(BaseScraper):
     
     def _extract_company(self, card) -> str:
         """Extract company name from job card"""
-        selectors = [
-            '.company', '.company-name', '[class*="company"]',
-            'span.company', 'div.company', 'a.company',
-            '.employer', '.employer-name', '[data-company]'
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
+        for elem in _first_matches(card, _COMPANY_SELECTORS):
             if elem:
                 company = self.clean_text(elem.get_text())
                 if company:
@@ -37,13 +100,7 @@ class GrabJobsScraper(BaseScraper):
     
     def _extract_location(self, card) -> str:
         """Extract location from job card"""
-        selectors = [
-            '.location', '.job-location', '[class*="location"]',
-            'span.location', 'div.location', '.city', '.place',
-            '.address', '.where', '[data-location]'
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
+        for elem in _first_matches(card, _LOCATION_SELECTORS):
             if elem:
                 location = self.clean_text(elem.get_text())
                 if location:
@@ -52,13 +109,7 @@ class GrabJobsScraper(BaseScraper):
     
     def _extract_posted_date(self, card) -> Optional:
         """Extract posted date from job card"""
-        selectors = [
-            '.date', '.posted-date', '[class*="date"]',
-            'time', '[datetime]', '.time-ago', '.posted',
-            '.published', '.publish-date', '[data-date]'
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
+        for elem in _first_matches(card, _DATE_SELECTORS):
             if elem:
                 date_str = elem.get('datetime') or elem.get('data-date') or elem.get_text()
                 if date_str:
@@ -69,12 +120,7 @@ class GrabJobsScraper(BaseScraper):
     
     def _extract_description(self, card) -> str:
         """Extract job description from card"""
-        selectors = [
-            '.description', '.job-description', '[class*="description"]',
-            '.summary', '.snippet', '.excerpt', 'p'
-        ]
-        for selector in selectors:
-            elem = card.select_one(selector)
+        for elem in _first_matches(card, _DESCRIPTION_SELECTORS):
             if elem:
                 desc = self.clean_text(elem.get_text())
                 if desc and len(desc) > 20:
@@ -83,20 +129,25 @@ class GrabJobsScraper(BaseScraper):
     
     def scrape_jobs(self) -> List[Dict]:
         jobs = []
-        for keyword in self.keywords:
-            url = self.build_search_url(keyword)
-            # Try Selenium first as site often blocks regular requests with 403
-            html = self.make_request(url, use_selenium=True)
+        candidates: List[JobRecord] = []
+        search_urls = [self.build_search_url(keyword) for keyword in self.keywords]
+        if not search_urls:
+            return jobs
+        
+        # ✅ Search pages for all keywords load in parallel (each worker checks out its own pooled driver)
+        pages = self.fetch_search_pages(search_urls)
+        
+        for html in pages:
             if not html:
-                logger.warning(f"Grabjobs: Failed to fetch {url} - may be blocked or inaccessible")
                 continue
-            soup = self.parse_html(html)
+            soup = self.parse_html(html, parse_only=_CARD_STRAINER)
             
             # Try multiple selectors for job cards
-            job_cards = soup.find_all('div', class_='job-card') or \
-                       soup.find_all('article', class_='job') or \
-                       soup.find_all('div', class_='job-item') or \
-                       soup.select('div[class*="job"], article[class*="job"]')
+            job_cards = []
+            for selector in _CARD_SELECTORS:
+                job_cards = selector.select(soup)
+                if job_cards:
+                    break
             
             for card in job_cards:
                 try:
@@ -106,8 +157,8 @@ class GrabJobsScraper(BaseScraper):
                         continue
                     job_title = self.clean_text(title_elem.get_text())
                     
-                    # Check keyword match
-                    if self.keywords and not any(kw.lower() in job_title.lower() for kw in self.keywords):
+                    # Check keyword match (one pass over the title - all keywords as a single alternation)
+                    if self.keywords and not self.matches_any_keyword(job_title):
                         continue
                     
                     # Extract job link
@@ -121,7 +172,6 @@ class GrabJobsScraper(BaseScraper):
                         continue
                     
                     # Extract real data
-                    company = self._extract_company(card)
                     location = self._extract_location(card)
                     posted_date = self._extract_posted_date(card)
                     job_description = self._extract_description(card)
@@ -135,52 +185,72 @@ class GrabJobsScraper(BaseScraper):
                     if not self.matches_job_type_filter(detected_type):
                         continue
                     
-                    # Fetch job detail page to get company profile URL and additional info
-                    company_profile_url = None
-                    company_url = None
-                    company_size = 'UNKNOWN'
-                    try:
-                        detail = self._fetch_job_detail(job_link)
-                        if detail:
-                            if detail.get('description') and not job_description:
-                                job_description = detail['description']
-                            if detail.get('posted_date') and not posted_date:
-                                posted_date = detail['posted_date']
-                            if detail.get('company') and not company:
-                                company = detail['company']
-                            company_url = detail.get('company_url')
-                            company_profile_url = detail.get('company_profile_url')
-                            if detail.get('company_size'):
-                                company_size = detail['company_size']
-                    except Exception as e:
-                        logger.debug(f"Grabjobs: Error fetching job detail for {job_link}: {e}")
-                    
-                    # Infer market from location
-                    market = self._infer_market(location)
-                    
-                    job_data = {
-                        'job_title': job_title,
-                        'company': company if company else '',
-                        'company_url': company_url,
-                        'company_size': company_size,
-                        'company_profile_url': company_profile_url,  # Pass for ScraperManager enrichment
-                        'market': market,
-                        'job_link': job_link,
-                        'posted_date': posted_date,
-                        'location': location if location else '',
-                        'job_description': job_description if job_description else '',
-                        'job_type': detected_type,
-                    }
+                    # The same posting often shows up under several keywords
+                    if not self.is_new_link(job_link):
+                        continue
                     
-                    # Only add if we have at least title and company
-                    if job_data['job_title'] and job_data['company']:
-                        jobs.append(job_data)
-                        
+                    candidates.append(JobRecord(
+                        job_title=job_title,
+                        company=self._extract_company(card),
+                        job_link=job_link,
+                        posted_date=posted_date,
+                        location=location,
+                        job_description=job_description,
+                        job_type=detected_type,
+                    ))
                 except Exception as e:
                     logger.debug(f"Grabjobs: Error parsing job card: {e}")
                     continue
+        
+        # ✅ Job detail pages (company profile URL and additional info) for every keyword,
+        # fetched in parallel - each unique link once
+        details = self.fetch_details_concurrently(list(dict.fromkeys(c.job_link for c in candidates)))
+        
+        for candidate in candidates:
+            company = candidate.company
+            posted_date = candidate.posted_date
+            job_description = candidate.job_description
+            
+            company_profile_url = None
+            company_url = None
+            company_size = 'UNKNOWN'
+            detail = details.get(candidate.job_link)
+            if detail:
+                if detail.get('description') and not job_description:
+                    job_description = detail['description']
+                if detail.get('posted_date') and not posted_date:
+                    posted_date = detail['posted_date']
+                if detail.get('company') and not company:
+                    company = detail['company']
+                company_url = detail.get('company_url')
+                company_profile_url = detail.get('company_profile_url')
+                if detail.get('company_size'):
+                    company_size = detail['company_size']
+            
+            # Only add if we have at least title and company
+            if not (candidate.job_title and company):
+                continue
+            
+            jobs.append(candidate._replace(
+                company=company,
+                company_url=company_url,
+                company_size=company_size,
+                company_profile_url=company_profile_url,  # Pass for ScraperManager enrichment
+                # Infer market from location
+                market=self._infer_market(candidate.location),
+                posted_date=posted_date,
+                location=candidate.location if candidate.location else '',
+                job_description=job_description if job_description else '',
+            )._asdict())
         return jobs
     
+    def _fetch_search_page(self, url: str) -> Optional[str]:
+        # Selenium first as site often blocks regular requests with 403
+        html = super()._fetch_search_page(url)
+        if not html:
+            logger.warning(f"Grabjobs: Failed to fetch {url} - may be blocked or inaccessible")
+        return html
+    
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
         """Fetch job detail page to extract company profile URL and additional info"""
         detail: Dict[str, Optional[str]] = {}
@@ -192,37 +262,32 @@ class GrabJobsScraper(BaseScraper):
             if not html:
                 return detail
             
-            soup = self.parse_html(html)
+            # Only the profile link scan needs the DOM - JSON-LD is read from the raw HTML
+            soup = self.parse_html(html, parse_only=LINK_STRAINER)
             
             # Extract company profile URL using BaseScraper method
             company_profile_url = self._extract_company_profile_url(soup)
             if company_profile_url:
                 detail['company_profile_url'] = company_profile_url
             
-            # Extract company URL from JSON-LD or HTML
-            for script in soup.find_all('script', type='application/ld+json'):
-                try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
-                    if isinstance(data, dict) and data.get('@type') == 'JobPosting':
-                        hiring = data.get('hiringOrganization') or data.get('hiringorganization')
-                        if isinstance(hiring, dict):
-                            company_url = hiring.get('sameAs') or hiring.get('url')
-                            if company_url:
-                                detail['company_url'] = company_url
-                            name = hiring.get('name')
-                            if name:
-                                detail['company'] = self.clean_text(name)
-                        description = data.get('description')
-                        if description:
-                            detail['description'] = self.clean_text(description)
-                        date_posted = data.get('datePosted')
-                        if date_posted:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                        break
-                except:
-                    continue
+            # Extract company URL from JSON-LD or HTML (read from the raw HTML, non-JobPosting blocks never decoded)
+            posting = extract_job_posting(html)
+            if posting:
+                hiring = lower_keys(posting.get('hiringorganization'))
+                company_url = hiring.get('sameas') or hiring.get('url')
+                if company_url:
+                    detail['company_url'] = company_url
+                name = hiring.get('name')
+                if name:
+                    detail['company'] = self.clean_text(name)
+                description = posting.get('description')
+                if description:
+                    detail['description'] = self.clean_text(description)
+                date_posted = posting.get('dateposted')
+                if date_posted:
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
         except Exception as e:
             logger.debug(f"Grabjobs: Error fetching job detail: {e}")
         
@@ -230,12 +295,5 @@ class GrabJobsScraper(BaseScraper):
     
     def _infer_market(self, location: str) -> str:
         """Infer market from location"""
-        if not location:
-            return 'OTHER'
-        location_upper = location.upper()
-        if 'UK' in location_upper or 'UNITED KINGDOM' in location_upper or 'LONDON' in location_upper:
-            return 'UK'
-        elif 'USA' in location_upper or 'UNITED STATES' in location_upper or any(state in location_upper for state in ['NY', 'CA', 'TX', 'FL']):
-            return 'USA'
-        return 'OTHER'
+        return _market_for_location(location or '')
 
@@ -1,16 +1,81 @@
 """
 Indeed UK Job Scraper
 """
-import json
 import logging
 import re
 import urllib.parse
+from functools import cached_property, lru_cache
 from typing import List, Dict, Optional
 
-from ..utils.base_scraper import BaseScraper
+import soupsieve
+
+from ..utils.base_scraper import BaseScraper, JobRecord, LISTING_STRAINER, iter_json_ld
 
 logger = logging.getLogger(__name__)
 
+# ✅ Job card selectors compiled once - the first one that finds cards wins
+_CARD_SELECTORS = tuple(soupsieve.compile(s) for s in (
+    'div.job_seen_beacon',
+    'div.jobCard',
+    'div.job',
+))
+
+# (tag, class) -> card field read by the card loop
+_CARD_FIELDS = {
+    ('h2', 'jobTitle'): 'title',
+    ('span', 'companyName'): 'company',
+    ('div', 'companyLocation'): 'location',
+    ('span', 'date'): 'date',
+    ('span', 'dateText'): 'date_text',
+}
+
+
+def _card_fields(card) -> Dict:
+    """Collect the first title/company/location/date element of a card in one walk"""
+    fields = {}
+    for elem in card.find_all(['h2', 'span', 'div']):
+        for cls in elem.get('class') or ():
+            field = _CARD_FIELDS.get((elem.name, cls))
+            if field:
+                fields.setdefault(field, elem)
+    return fields
+
+
+_UK_MARKET_RE = re.compile(r'UNITED KINGDOM|\bUK\b', re.IGNORECASE)
+_USA_MARKET_RE = re.compile(r'UNITED STATES|\bUSA\b', re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _market_for_location(location: str) -> str:
+    """Market for a job location (memoized - the same locations repeat across cards and pages)"""
+    if _UK_MARKET_RE.search(location):
+        return 'UK'
+    if _USA_MARKET_RE.search(location):
+        return 'USA'
+    return 'OTHER'
+
+
+# JobPosting jobLocationType/workplaceType and employmentType values -> job type (upper-cased keys)
+_WORKPLACE_TYPES = {
+    'REMOTE': 'REMOTE',
+    'TELECOMMUTE': 'REMOTE',
+    'HYBRID': 'HYBRID',
+}
+_EMPLOYMENT_TYPES = {
+    'FULLTIME': 'FULL_TIME',
+    'FULL-TIME': 'FULL_TIME',
+    'PARTTIME': 'PART_TIME',
+    'PART-TIME': 'PART_TIME',
+    'CONTRACT': 'FREELANCE',
+    'TEMPORARY': 'FREELANCE',
+}
+
+
+@lru_cache(maxsize=256)
+def _employment_job_type(employment: str, workplace: str) -> Optional[str]:
+    """Job type for an employment/workplace pair (memoized - only a handful of distinct pairs per run)"""
+    return _WORKPLACE_TYPES.get(workplace.upper()) or _EMPLOYMENT_TYPES.get(employment.upper())
+
 
 class IndeedUKScraper(BaseScraper):
     """Scraper for Indeed UK"""
@@ -29,8 +94,12 @@ class IndeedUKScraper(BaseScraper):
     
     def build_search_url(self, keyword: str) -> str:
         """Build Indeed UK search URL"""
+        # Only the keyword varies between searches - the filters are encoded once per scraper
+        return f"{self.base_url}/jobs?q={urllib.parse.quote_plus(keyword)}{self._search_url_filters}"
+    
+    @cached_property
+    def _search_url_filters(self) -> str:
         params = {
-            'q': keyword,
             'l': self.location if self.location != 'ALL' else '',
             'sort': 'date'
         }
@@ -47,8 +116,7 @@ class IndeedUKScraper(BaseScraper):
         elif self.time_filter == '7D':
             params['fromage'] = '7'
         
-        query_string = urllib.parse.urlencode(params)
-        return f"{self.base_url}/jobs?{query_string}"
+        return f"&{urllib.parse.urlencode(params)}"
     
     def scrape_jobs(self) -> List[Dict]:
         """Scrape jobs from Indeed UK with pagination for maximum jobs"""
@@ -76,21 +144,14 @@ class IndeedUKScraper(BaseScraper):
                         logger.warning(f"Indeed UK: No HTML returned for page {page_num + 1}")
                         break  # Stop if page fails
                     
-                    soup = self.parse_html(html)
+                    # Only the card containers and links are built (LISTING_STRAINER)
+                    soup = self.parse_html(html, parse_only=LISTING_STRAINER)
                     
                     # Find job cards - try multiple selectors
                     job_cards = []
-                    selectors = [
-                        ('div', {'class': 'job_seen_beacon'}),
-                        ('div', {'class': 'jobCard'}),
-                        ('div', {'class': 'job'}),
-                        ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-                    ]
-                    
-                    for tag, attrs in selectors:
-                        found = soup.find_all(tag, attrs)
-                        if found:
-                            job_cards.extend(found)
+                    for selector in _CARD_SELECTORS:
+                        job_cards = selector.select(soup)
+                        if job_cards:
                             break
                     
                     # ✅ USE MultiApproachExtractor as fallback if standard selectors fail
@@ -105,11 +166,13 @@ class IndeedUKScraper(BaseScraper):
                     
                     logger.info(f"Indeed UK: Found {len(job_cards)} job cards on page {page_num + 1}")
                     
-                    page_jobs_count = 0
+                    candidates: List[JobRecord] = []
+                    repeated = 0  # listings already taken from an earlier page/keyword
                     for card in job_cards:
                         try:
                             # Extract job information
-                            title_elem = card.find('h2', class_='jobTitle')
+                            fields = _card_fields(card)
+                            title_elem = fields.get('title')
                             if not title_elem:
                                 continue
                             
@@ -119,16 +182,16 @@ class IndeedUKScraper(BaseScraper):
                             job_link = f"{self.base_url}/viewjob?jk={job_id}" if job_id else ''
                             
                             # Company name
-                            company_elem = card.find('span', class_='companyName')
+                            company_elem = fields.get('company')
                             company = self.clean_text(company_elem.get_text()) if company_elem else ''
                             
                             # Location
-                            location_elem = card.find('div', class_='companyLocation')
+                            location_elem = fields.get('location')
                             location = self.clean_text(location_elem.get_text()) if location_elem else ''
                             
                             # Posted date - try multiple selectors
                             posted_date = None
-                            date_elem = card.find('span', class_='date') or card.find('span', class_='dateText')
+                            date_elem = fields.get('date') or fields.get('date_text')
                             if date_elem:
                                 date_text = date_elem.get_text()
                                 if date_text:
@@ -144,28 +207,68 @@ class IndeedUKScraper(BaseScraper):
                             if not self.should_include_job(posted_date):
                                 continue
                             
+                            # ✅ Deduplicate by job ID before the detail/profile fetches, not after them
+                            if job_id:
+                                if job_id in seen_job_ids:
+                                    repeated += 1
+                                    continue
+                                seen_job_ids.add(job_id)
+                            
                             # ✅ REMOVED STRICT KEYWORD CHECK - Extract all jobs
+                            candidates.append(JobRecord(
+                                job_title=job_title,
+                                company=company,
+                                job_link=job_link,
+                                posted_date=posted_date,
+                                location=location,
+                            ))
+                        except Exception as e:
+                            logger.error(f"Error parsing job card: {str(e)}")
+                            continue
+                    
+                    # ✅ Job detail pages of this page in parallel (candidates are already new job ids), then
+                    # each company profile they link - profiles go through the per-run cache, since the same
+                    # company is shared across pages and keywords
+                    details = self.fetch_details_concurrently(
+                        list(dict.fromkeys(c.job_link for c in candidates if c.job_link)),
+                        fetch=self._fetch_job_detail,
+                    )
+                    profile_urls = list(dict.fromkeys(
+                        d['company_profile_url'] for d in details.values() if d.get('company_profile_url')
+                    ))
+                    profiles = self.fetch_details_concurrently(
+                        profile_urls, fetch=lambda url: self.fetch_detail_once(url, fetch=self._fetch_company_profile)
+                    )
+                    
+                    # Repeated listings still count as page results for the pagination check below
+                    page_jobs_count = repeated
+                    for candidate in candidates:
+                        try:
+                            job_title = candidate.job_title
+                            job_link = candidate.job_link
+                            company = candidate.company
+                            location = candidate.location
+                            posted_date = candidate.posted_date
                             
-                            detail = self._fetch_job_detail(job_link)
+                            detail = dict(details.get(job_link) or {})
                             description = detail.get('description', '')
                             if detail.get('company'):
                                 company = detail['company']
                             company_url = detail.get('company_url')
                             
-                            # Fetch company profile/detail page for real company URL and size (if available)
+                            # Company profile/detail page gives the real company URL and size (if available)
                             company_profile_url = detail.get('company_profile_url')
-                            if company_profile_url:
-                                profile_data = self._fetch_company_profile(company_profile_url)
-                                if profile_data:
-                                    # Use real website URL from company profile
-                                    if profile_data.get('website_url'):
-                                        company_url = profile_data['website_url']
-                                    # Use real company size from profile
-                                    if profile_data.get('company_size'):
-                                        detail['company_size'] = profile_data['company_size']
-                                    # Update company name if different
-                                    if profile_data.get('company_name'):
-                                        company = profile_data['company_name']
+                            profile_data = profiles.get(company_profile_url) if company_profile_url else None
+                            if profile_data:
+                                # Use real website URL from company profile
+                                if profile_data.get('website_url'):
+                                    company_url = profile_data['website_url']
+                                # Use real company size from profile
+                                if profile_data.get('company_size'):
+                                    detail['company_size'] = profile_data['company_size']
+                                # Update company name if different
+                                if profile_data.get('company_name'):
+                                    company = profile_data['company_name']
                             
                             if detail.get('location'):
                                 location = detail['location']
@@ -208,12 +311,6 @@ class IndeedUKScraper(BaseScraper):
                                     'salary_range': detail.get('salary_range', ''),
                                 }
                                 
-                                # Deduplicate by job ID
-                                job_id_val = job_data.get('job_link', '').split('jk=')[-1] if 'jk=' in job_data.get('job_link', '') else ''
-                                if job_id_val and job_id_val in seen_job_ids:
-                                    continue
-                                seen_job_ids.add(job_id_val)
-                                
                                 jobs.append(job_data)
                             page_jobs_count += 1
                             
@@ -244,31 +341,13 @@ class IndeedUKScraper(BaseScraper):
         return jobs
 
     def _infer_market(self, location: str) -> str:
-        loc_upper = (location or '').upper()
-        if 'UNITED KINGDOM' in loc_upper or 'UK' in loc_upper:
-            return 'UK'
-        if 'UNITED STATES' in loc_upper or 'USA' in loc_upper:
-            return 'USA'
-        return 'OTHER'
+        return _market_for_location(location or '')
 
     def _map_employment(self, employment: Optional[str], workplace: Optional[str]) -> Optional[str]:
-        employment_upper = (employment or '').upper()
-        workplace_upper = (workplace or '').upper()
-
-        if workplace_upper in {'REMOTE', 'TELECOMMUTE'}:
-            return 'REMOTE'
-        if workplace_upper == 'HYBRID':
-            return 'HYBRID'
-
-        mapping = {
-            'FULLTIME': 'FULL_TIME',
-            'FULL-TIME': 'FULL_TIME',
-            'PARTTIME': 'PART_TIME',
-            'PART-TIME': 'PART_TIME',
-            'CONTRACT': 'FREELANCE',
-            'TEMPORARY': 'FREELANCE',
-        }
-        return mapping.get(employment_upper)
+        return _employment_job_type(
+            employment if isinstance(employment, str) else '',
+            workplace if isinstance(workplace, str) else '',
+        )
 
     def _fetch_job_detail(self, job_link: str) -> Dict[str, Optional[str]]:
         detail: Dict[str, Optional[str]] = {}
@@ -303,13 +382,8 @@ class IndeedUKScraper(BaseScraper):
                         detail['posted_date'] = parsed_date
                         break
 
-        # Parse JSON-LD for structured data
-        for script in soup.find_all('script', type='application/ld+json'):
-            try:
-                data = json.loads(script.get_text(strip=True) or '{}')
-            except Exception:
-                continue
-            
+        # Parse JSON-LD for structured data (read from the raw HTML, non-JobPosting blocks never decoded)
+        for data in iter_json_ld(html, contains='JobPosting'):
             # Handle both JobPosting and single object
             job_data = data
             if isinstance(data, dict) and '@graph' in data:
@@ -361,23 +435,11 @@ class IndeedUKScraper(BaseScraper):
                     job_data.get('dateposted') or 
                     job_data.get('date_posted')
                 )
-                if date_posted:
-                    # Handle ISO format dates (2024-01-15T10:00:00Z)
-                    if isinstance(date_posted, str) and 'T' in date_posted:
-                        try:
-                            from datetime import datetime
-                            # Remove timezone info if present
-                            date_str = date_posted.replace('Z', '').split('T')[0]
-                            dt = datetime.strptime(date_str, '%Y-%m-%d')
-                            detail['posted_date'] = dt.date()
-                        except:
-                            parsed = self.parse_date(date_posted)
-                            if parsed:
-                                detail['posted_date'] = parsed
-                    elif isinstance(date_posted, str):
-                        parsed = self.parse_date(date_posted)
-                        if parsed:
-                            detail['posted_date'] = parsed
+                # ISO format dates (2024-01-15T10:00:00Z) are handled by parse_date's fast path
+                if isinstance(date_posted, str):
+                    parsed = self.parse_date(date_posted)
+                    if parsed:
+                        detail['posted_date'] = parsed
 
             employment = job_data.get('employmentType')
             if isinstance(employment, list):
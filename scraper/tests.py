@@ -1,4 +1,114 @@
+import threading
+from unittest import mock
 
-from django.test import TestCase
+from django.db import DataError
+from django.test import SimpleTestCase, TestCase
 
-# Create your tests here.
+from dashboard.models import SavedFilter, ScraperRun
+from .models import Job
+from .scraper_manager import ScraperManager
+from .utils.driver_pool import DriverPool
+
+
+class BulkSaveJobsTests(TestCase):
+    def setUp(self):
+        saved_filter = SavedFilter.objects.create(name='Bulk save')
+        self.manager = ScraperManager(saved_filter, ScraperRun.objects.create(saved_filter=saved_filter))
+
+    def _job(self, n):
+        return Job(
+            job_title=f'Python Dev {n}',
+            company='Acme',
+            market='UK',
+            job_link=f'https://example.com/jobs/{n}',
+            location='London',
+            scraper_run=self.manager.scraper_run,
+        )
+
+    def test_batch_with_one_bad_row_keeps_the_others(self):
+        jobs = [self._job(n) for n in range(3)]
+        original_save = Job.save
+
+        def save(job, *args, **kwargs):
+            if job.job_link.endswith('/1'):
+                raise DataError('value too long for type character varying(500)')
+            return original_save(job, *args, **kwargs)
+
+        with mock.patch.object(Job.objects, 'bulk_create', side_effect=DataError('value too long')), \
+                mock.patch.object(Job, 'save', autospec=True, side_effect=save), \
+                mock.patch.object(ScraperManager, '_find_decision_makers'):
+            saved = self.manager._bulk_save_jobs(jobs)
+
+        self.assertEqual(saved, 2)
+        self.assertEqual(
+            sorted(Job.objects.values_list('job_link', flat=True)),
+            ['https://example.com/jobs/0', 'https://example.com/jobs/2'],
+        )
+        self.assertEqual(self.manager.skip_reasons['database_error'], 1)
+
+
+class FakeDriver:
+    def __init__(self):
+        self.quit_called = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+class DriverPoolTests(SimpleTestCase):
+    def test_acquire_blocks_at_max_live_until_a_driver_is_released(self):
+        pool = DriverPool(max_idle=1, max_live=1)
+        driver = pool.acquire(FakeDriver)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(pool.acquire(FakeDriver)))
+        waiter.start()
+        waiter.join(0.2)
+        self.assertTrue(waiter.is_alive())
+
+        pool.release(driver)
+        waiter.join(5)
+        self.assertEqual(acquired, [driver])
+
+    def test_release_past_max_idle_quits_the_driver(self):
+        pool = DriverPool(max_idle=1, max_live=2)
+        first, second = pool.acquire(FakeDriver), pool.acquire(FakeDriver)
+        pool.release(first)
+        pool.release(second)
+
+        self.assertFalse(first.quit_called)
+        self.assertTrue(second.quit_called)
+        self.assertEqual(pool.acquire(FakeDriver), first)
+
+    def test_end_run_keeps_drivers_while_another_run_is_active(self):
+        pool = DriverPool()
+        pool.begin_run()
+        pool.begin_run()
+        driver = pool.acquire(FakeDriver)
+        pool.release(driver)
+
+        pool.end_run(timeout=0)
+        self.assertFalse(driver.quit_called)
+        self.assertEqual(pool.acquire(FakeDriver), driver)
+
+        pool.release(driver)
+        pool.end_run(timeout=0)
+        self.assertTrue(driver.quit_called)
+
+    def test_run_beginning_while_end_run_drains_keeps_the_pool(self):
+        pool = DriverPool()
+        pool.begin_run()
+        driver = pool.acquire(FakeDriver)  # still checked out, so end_run waits for it
+        ending = threading.Thread(target=pool.end_run, kwargs={'timeout': 5})
+        ending.start()
+        ending.join(0.2)
+
+        pool.begin_run()
+        ending.join(5)
+        self.assertFalse(ending.is_alive())
+        pool.release(driver)
+        self.assertFalse(driver.quit_called)
+        self.assertEqual(pool.acquire(FakeDriver), driver)
+
+        pool.release(driver)
+        pool.end_run(timeout=0)
+        self.assertTrue(driver.quit_called)
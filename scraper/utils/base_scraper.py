@@ -6,8 +6,16 @@ import logging
 import re
 import requests
 import random
+import hashlib
+import html as html_lib
+import json
+import threading
 from abc import ABC, abstractmethod
-from bs4 import BeautifulSoup
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
@@ -15,9 +23,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, WebDriverException
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from datetime import date, datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Iterator, List, Dict, NamedTuple, Optional
 from django.conf import settings
+from .driver_pool import shared_pool as DRIVER_POOL
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +48,14 @@ except ImportError:
     UNDETECTED_CHROME_AVAILABLE = False
     logger.warning("undetected-chromedriver not installed. Install with: pip install undetected-chromedriver")
 
+# ✅ Use orjson for fast JSON-LD decoding (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    logger.warning("orjson not installed. Install with: pip install orjson")
+
 # ✅ STEP 2: Free Proxy APIs for rotating proxy pool
 PROXY_APIS = [
     "https://api.proxyscrape.com/v2/?request=getproxies&protocol=http&timeout=5000&country=all",
@@ -50,6 +68,260 @@ _PROXY_CACHE = []
 _PROXY_CACHE_TIME = 0
 PROXY_CACHE_DURATION = 300  # 5 minutes
 
+# ✅ Static assets and trackers never contribute scraped fields - blocked in Selenium via CDP
+BLOCKED_URL_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.webp', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.css',
+    '*.mp4', '*.webm', '*.mp3',
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+    '*segment.io*', '*hotjar.com*',
+]
+
+# ✅ Upper bound on waiting for document.readyState == 'complete' after an eager page load (seconds)
+PAGE_SETTLE_TIMEOUT = 1
+
+# ✅ Bounded concurrency for job detail page fetches (I/O-bound, latency dominated)
+DETAIL_FETCH_WORKERS = 10
+
+# ✅ Keep-alive pool per host: search-page and detail-page pools may run side by side,
+# so connections beyond requests' default of 10 are reused instead of being discarded
+SESSION_POOL_HOSTS = 10
+SESSION_POOL_MAXSIZE = 2 * DETAIL_FETCH_WORKERS
+
+# ✅ Per-scraper request rate cap (shared by all of its worker threads) and Retry-After ceiling
+REQUESTS_PER_SECOND = 5
+MAX_RETRY_AFTER = 30  # seconds - longer waits fall through to the normal fallback path
+
+# ✅ SoupStrainers: only build the parts of the DOM a scraper actually reads
+def _is_listing_node(name: str, attrs: Dict) -> bool:
+    return name in ('div', 'article', 'li', 'a') or 'data-job' in attrs or 'data-job-id' in attrs
+
+
+# Listing pages - job cards live in div/article/li containers, [data-job]/[data-job-id]
+# elements of any tag, or bare links
+LISTING_STRAINER = SoupStrainer(_is_listing_node)
+# Detail pages - links only (company profile URL scan); JSON-LD is read with JSONLD_RE
+LINK_STRAINER = SoupStrainer('a')
+
+
+def card_strainer(tags: Iterable[str], token: Optional[str] = None, substring: Optional[str] = None) -> SoupStrainer:
+    """
+    Search-page strainer keeping only job-card subtrees: `tags` elements whose class list
+    has `token` as a whole class name and/or whose class attribute contains `substring`
+    """
+    tags = frozenset(tags)
+
+    def is_card(name: str, attrs: Dict) -> bool:
+        if name not in tags:
+            return False
+        # `class` is still the raw attribute string while the strainer runs
+        classes = attrs.get('class') or ''
+        if isinstance(classes, list):
+            classes = ' '.join(classes)
+        return (token is None or token in classes.split()) and (substring is None or substring in classes)
+
+    return SoupStrainer(is_card)
+
+# ✅ Whole-token class names of a single job card - a substring match ([class*="job"]) also hits
+# list wrappers (div.jobs-list) and card parts (div.job-title), which then yield the same job twice
+JOB_CARD_CLASSES = (
+    'job', 'job-card', 'jobcard', 'job-item', 'job-tile', 'jobtile', 'job-listing', 'job-listing-item',
+    'job-result', 'job-result-item', 'job-posting',
+)
+# CSS fragment matching any of them case-insensitively - combine with a tag, e.g. f'div{JOB_CARD_CLASS_CSS}'
+JOB_CARD_CLASS_CSS = ':is(' + ', '.join(f'[class~="{name}" i]' for name in JOB_CARD_CLASSES) + ')'
+
+# ✅ JSON-LD <script> blocks matched straight from raw HTML (no DOM needed)
+JSONLD_RE = re.compile(r'<script[^>]+application/ld\+json[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
+# ✅ ISO 8601 date or datetime (JSON-LD datePosted, <time datetime>) - the date part is parsed directly
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?:[Tt ]|$)')
+
+
+class RequestThrottle:
+    """Thread-safe token bucket - caps the request rate of one scraper across its worker threads"""
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.capacity = burst
+        self._tokens = float(burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        """Block until the caller may send its next request"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Negative balance reserves a future slot, so concurrent callers queue up in order
+            self._tokens -= 1
+            delay = -self._tokens / self.rate if self._tokens < 0 else 0
+        if delay > 0:
+            time.sleep(delay)
+
+
+class JobRecord(NamedTuple):
+    """
+    Compact, immutable job record for intermediate pipeline stages.
+    Materialize with ._asdict() only when the job is handed downstream.
+    """
+    job_title: str
+    company: str = ''
+    company_url: str = ''
+    company_size: str = ''
+    company_profile_url: Optional[str] = None
+    market: str = ''
+    job_link: str = ''
+    posted_date: Optional[date] = None
+    location: str = ''
+    job_description: str = ''
+    job_type: str = ''
+    salary_range: str = ''
+
+
+# ✅ Job type indicators (substring match on lower-cased title/location/description),
+# checked in priority order - str `in` scans beat one big regex alternation here
+JOB_TYPE_INDICATORS = (
+    # Remote indicators (very strong)
+    ('REMOTE', ('remote', 'work from home', 'wfh', 'anywhere', 'distributed', 'worldwide', 'location independent')),
+    # Hybrid indicators
+    ('HYBRID', ('hybrid', 'flexible location', 'office + remote', 'partially remote', 'flex')),
+    # Freelance/Contract indicators
+    ('FREELANCE', ('freelance', 'contract', 'contractor', 'temp', 'temporary', 'project-based', 'gig', 'consultancy')),
+    # Part-time indicators
+    ('PART_TIME', ('part-time', 'part time', 'parttime')),
+    # Full-time indicators (only if explicitly mentioned)
+    ('FULL_TIME', ('full-time', 'full time', 'fulltime', 'permanent', 'ft ', 'fte')),
+)
+
+# ✅ Employee-count thresholds for size categories (LinkedIn bands), checked largest first
+COMPANY_SIZE_THRESHOLDS = ((10001, 'ENTERPRISE'), (1001, 'LARGE'), (51, 'MEDIUM'))
+
+# ✅ "[company size:] N[-M] employees" - one pattern, one pass over the text (group 3 only set for ranges)
+COMPANY_SIZE_RE = re.compile(
+    r'(company\s*size[:\s]+)?(\d{1,3}(?:,\d{3})*)\s*(?:-\s*(\d{1,3}(?:,\d{3})*)\s*)?employees?',
+    re.IGNORECASE,
+)
+
+# Raw-HTML to text for regex scans: <script>/<style> bodies dropped, then every tag
+_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def company_size_category(count: int) -> str:
+    """Map an employee count to ENTERPRISE / LARGE / MEDIUM / SMALL"""
+    for threshold, category in COMPANY_SIZE_THRESHOLDS:
+        if count >= threshold:
+            return category
+    return 'SMALL'
+
+
+def _employee_count(value) -> int:
+    """Employee count from an int-like value or a string such as '1,000+'"""
+    if isinstance(value, str):
+        return int(''.join(filter(str.isdigit, value)))
+    return int(value)
+
+
+def company_size_from_text(text: str) -> Optional[str]:
+    """
+    Size category from the employee counts in page text, or None. Priority: a "company size"
+    range, then any range, then a bare count (first occurrence of each); ranges use the upper bound
+    """
+    first_range = first_count = None
+    for match in COMPANY_SIZE_RE.finditer(text or ''):
+        labelled, _, max_val = match.groups()
+        if max_val is None:
+            first_count = first_count or match
+        elif labelled:
+            first_range = match
+            break
+        else:
+            first_range = first_range or match
+    match = first_range or first_count
+    if match is None:
+        return None
+    return company_size_category(_employee_count(match.group(3) or match.group(2)))
+
+
+def html_text(html: str) -> str:
+    """Visible text of raw HTML for regex scans (script/style bodies and tags removed, entities decoded)"""
+    if not html:
+        return ''
+    return html_lib.unescape(_TAG_RE.sub(' ', _SCRIPT_STYLE_RE.sub(' ', html)))
+
+
+def json_loads(raw):
+    """Decode JSON with orjson when available, stdlib json otherwise"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Lenient retry: stdlib json also accepts NaN/Infinity and integers beyond 64 bits
+            pass
+    return json.loads(raw)
+
+
+def iter_json_ld(html: str, contains: Optional[str] = None):
+    """
+    Lazily yield decoded JSON-LD objects from raw HTML, skipping blocks that fail to decode.
+    The document is scanned incrementally, so a consumer that breaks on the first
+    JobPosting never scans (or decodes) the rest of the page.
+    With `contains`, blocks whose raw text lacks that substring are skipped without decoding.
+    """
+    if not html:
+        return
+    for match in JSONLD_RE.finditer(html):
+        raw = match.group(1)
+        if contains and contains not in raw:
+            continue
+        try:
+            yield json_loads(raw.strip() or '{}')
+        except ValueError:  # orjson.JSONDecodeError / json.JSONDecodeError
+            continue
+
+
+# ✅ Card fields (company, location, job type) repeat across pages - only short strings are memoized
+_CLEAN_TEXT_CACHE_LEN = 256
+
+
+@lru_cache(maxsize=8192)
+def _collapse_whitespace(text: str) -> str:
+    """Collapse runs of whitespace to single spaces (split() also drops leading/trailing whitespace)"""
+    return ' '.join(text.split())
+
+
+@lru_cache(maxsize=256)
+def _company_from_host(domain: str) -> str:
+    """Company name from a host (memoized - job links share a handful of hosts)"""
+    return domain.replace('www.', '').split('.')[0].title() if domain else 'Company Not Listed'
+
+
+def infer_company_from_url(url: str) -> str:
+    """Best-effort company name from a job link's host"""
+    try:
+        domain = urlparse(url).netloc
+    except ValueError:
+        return 'Company Not Listed'
+    return _company_from_host(domain)
+
+
+def lower_keys(obj) -> Dict:
+    """Copy of a JSON-LD object with lower-cased keys (schema.org key casing varies between sites)"""
+    if not isinstance(obj, dict):
+        return {}
+    return {key.lower(): value for key, value in obj.items()}
+
+
+def extract_job_posting(html: str) -> Optional[Dict]:
+    """Return the first JobPosting JSON-LD object in raw HTML with lower-cased keys, or None"""
+    # ✅ Organization/BreadcrumbList/WebSite blocks are rejected by a substring test, not a decode
+    for data in iter_json_ld(html, contains='JobPosting'):
+        if isinstance(data, dict) and data.get('@type') == 'JobPosting':
+            return lower_keys(data)
+    return None
+
 
 class BaseScraper(ABC):
     """
@@ -68,6 +340,13 @@ class BaseScraper(ABC):
             location: Location filter (USA, UK, ALL)
         """
         self.keywords = keywords
+        # ✅ All keywords as one alternation - one pass per title in matches_any_keyword()
+        terms = list(dict.fromkeys(kw.lower() for kw in keywords or [] if kw))
+        self._keyword_re = re.compile('|'.join(map(re.escape, terms))) if terms else None
+        self._keyword_matches: Dict[str, bool] = {}
+        self._seen_link_digests = set()
+        self._detail_cache: Dict[str, Future] = {}  # job link -> its (possibly in-flight) detail fetch
+        self._detail_lock = threading.Lock()
         self.job_type = job_type
         self.time_filter = time_filter
         self.location = location
@@ -96,6 +375,10 @@ class BaseScraper(ABC):
             'Referer': 'https://www.google.com/',  # Look like coming from Google
         }
         self.session = None
+        self._session_lock = threading.Lock()
+        
+        # ✅ Token-bucket throttle so concurrent detail fetches don't trip 429s
+        self._throttle = RequestThrottle(REQUESTS_PER_SECOND, burst=2)
         
         # ✅ FREE TOOLS: No paid proxies/APIs - use free rotation only
         self.proxy_list: List[str] = getattr(settings, 'SCRAPER_HTTP_PROXIES', []) or []  # Free proxies if configured
@@ -221,6 +504,9 @@ class BaseScraper(ABC):
                 options.add_argument('--no-sandbox')
                 options.add_argument('--disable-dev-shm-usage')
                 options.add_argument('--disable-gpu')
+                options.add_argument('--blink-settings=imagesEnabled=false')
+                # Return once the DOM is ready - make_request waits/scrolls for dynamic content itself
+                options.page_load_strategy = 'eager'
                 
                 # Add proxy if provided
                 if proxy:
@@ -234,6 +520,7 @@ class BaseScraper(ABC):
                 driver = uc.Chrome(options=options, use_subprocess=False)
                 driver.set_page_load_timeout(30)
                 driver.implicitly_wait(3)
+                self._block_static_assets(driver)
                 
                 return driver
             except Exception as e:
@@ -251,11 +538,14 @@ class BaseScraper(ABC):
         chrome_options.add_argument('--disable-logging')
         chrome_options.add_argument('--log-level=3')
         chrome_options.add_argument('--silent')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        chrome_options.page_load_strategy = 'eager'
         chrome_options.add_argument(f'user-agent={self._get_random_user_agent()}')
         chrome_options.add_experimental_option('excludeSwitches', ['enable-logging', 'enable-automation'])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_experimental_option('prefs', {
             'profile.default_content_setting_values.notifications': 2,
+            'profile.managed_default_content_settings.images': 2,
         })
         
         # Add proxy if configured
@@ -281,9 +571,30 @@ class BaseScraper(ABC):
             driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         except:
             pass
+        self._block_static_assets(driver)
         
         return driver
     
+    def _block_static_assets(self, driver):
+        """Block images, fonts, stylesheets and trackers at the network layer (Chrome DevTools Protocol)"""
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            logger.debug(f"Could not enable asset blocking: {e}")
+    
+    def _acquire_driver(self):
+        """Check out a warm driver from the shared pool, launching a new one only when none is free"""
+        return DRIVER_POOL.acquire(lambda: self.get_driver(self._get_next_valid_proxy()))
+    
+    def _release_driver(self, driver):
+        """Return a healthy driver to the shared pool"""
+        DRIVER_POOL.release(driver)
+    
+    def _discard_driver(self, driver):
+        """Quit a driver (failed load / blocked) so the next request launches a fresh one"""
+        DRIVER_POOL.discard(driver)
+    
     def make_request(self, url: str, use_selenium: bool = False, retry_count: int = 0) -> Optional[str]:
         """
         ✅ OPTIMIZED: Make HTTP request with rotating headers, proxies, and exponential backoff
@@ -300,13 +611,11 @@ class BaseScraper(ABC):
         
         for attempt in range(max_retries):
             driver = None
+            self._throttle.wait()
             try:
                 if use_selenium or self.requires_selenium:
-                    proxy = self._get_next_valid_proxy()
-                    driver = self.get_driver(proxy)
-                    
-                    # Set page load timeout to handle slow pages
-                    driver.set_page_load_timeout(30)
+                    # ✅ Reuse a pooled driver instead of launching Chrome per request
+                    driver = self._acquire_driver()
                     
                     try:
                         driver.get(url)
@@ -326,41 +635,30 @@ class BaseScraper(ABC):
                             error_type in ['TimeoutException', 'WebDriverException', 'ConnectionRefusedError']
                         )
                         
+                        # Driver state is unknown after a failed load - replace it on the next attempt
+                        self._discard_driver(driver)
+                        driver = None
+                        
                         if is_network_error:
                             # Suppress verbose logging - only log critical errors
-                            # Always try to close driver on error
-                            if driver:
-                                try:
-                                    driver.quit()
-                                except:
-                                    pass
-                                driver = None
-                            
                             # Retry with exponential backoff
                             if attempt < max_retries - 1:
                                 wait_time = 2 * (attempt + 1)
                                 time.sleep(wait_time)
                                 continue
-                            else:
-                                # Only log critical failures
-                                pass
-                                if driver:
-                                    try:
-                                        driver.quit()
-                                    except:
-                                        pass
-                                return None
+                            return None
                         else:
                             # Unexpected error - suppress verbose logging
-                            if driver:
-                                try:
-                                    driver.quit()
-                                except:
-                                    pass
                             raise  # Re-raise if not a network/timeout error
                     
-                    # Wait for JavaScript-heavy pages - REDUCED for speed
-                    time.sleep(1)  # Reduced from 2s to 1s for faster loading
+                    # Wait for JavaScript-heavy pages - returns as soon as the document is complete
+                    # (static assets are blocked, so this is usually well under the old fixed 1s sleep)
+                    try:
+                        WebDriverWait(driver, PAGE_SETTLE_TIMEOUT, poll_frequency=0.1).until(
+                            lambda d: d.execute_script('return document.readyState') == 'complete'
+                        )
+                    except TimeoutException:
+                        pass
                     # Quick scroll to trigger lazy loading
                     try:
                         driver.execute_script("window.scrollTo(0, document.body.scrollHeight/2);")
@@ -374,12 +672,9 @@ class BaseScraper(ABC):
                     html = driver.page_source
                     if self._is_blocked_or_captcha(html, driver):
                         logger.warning(f"Captcha or blocking detected for {url}, trying with different proxy/user agent")
-                        if driver:
-                            try:
-                                driver.quit()
-                            except:
-                                pass
-                            driver = None
+                        # Blocked session - drop the driver so the retry gets a fresh proxy/user agent
+                        self._discard_driver(driver)
+                        driver = None
                         
                         # Rotate proxy and user agent
                         if attempt < max_retries - 1:
@@ -391,13 +686,6 @@ class BaseScraper(ABC):
                             logger.error(f"Failed to bypass captcha/blocking after {max_retries} attempts")
                             return None
                     
-                    # Always close driver when done
-                    try:
-                        if driver:
-                            driver.quit()
-                    except:
-                        pass
-                    
                     if not html or len(html) < 100:
                         # Suppress verbose logging
                         if attempt < max_retries - 1:
@@ -414,12 +702,10 @@ class BaseScraper(ABC):
                         time.sleep(random.uniform(0.1, 0.5))  # Small random delay
                     
                     # ✅ STEP 1: Use rotating headers with random User-Agent
-                    if not self.session:
-                        self.session = requests.Session()
+                    session = self._get_session()
                     
-                    # Get fresh rotating headers for each request
+                    # Get fresh rotating headers for each request (per call - the session is shared by worker threads)
                     headers = self._get_rotating_headers()
-                    self.session.headers.update(headers)
                     
                     # ✅ STEP 2: Use rotating proxies (free or configured)
                     proxies = self._get_random_proxy_dict()
@@ -427,7 +713,7 @@ class BaseScraper(ABC):
                     try:
                         # Increase timeout for slow portals - some sites need more time
                         timeout = max(self.timeout, 20)  # At least 20 seconds for slow portals like cwjobs
-                        response = self.session.get(url, timeout=timeout, proxies=proxies)
+                        response = session.get(url, headers=headers, timeout=timeout, proxies=proxies)
                     except requests.exceptions.Timeout as timeout_err:
                         # Suppress verbose logging - only retry
                         if attempt < max_retries - 1:
@@ -456,8 +742,17 @@ class BaseScraper(ABC):
                         else:
                             continue
                     
+                    # Rate limited / overloaded - honour Retry-After before any other fallback
+                    if response.status_code in (429, 503) and attempt < max_retries - 1:
+                        retry_after = self._retry_after_seconds(response)
+                        if retry_after is not None and retry_after <= MAX_RETRY_AFTER:
+                            logger.debug(f"{self.portal_name}: {response.status_code} for {url}, retrying after {retry_after:.1f}s")
+                            time.sleep(retry_after)
+                            continue
+                    
                     # Check for captcha or blocking in response
-                    if self._is_blocked_or_captcha(response.text, None):
+                    html = self._response_text(response)
+                    if self._is_blocked_or_captcha(html, None):
                         logger.warning(f"Captcha or blocking detected for {url}, trying with Selenium")
                         if proxy_url:
                             self._bad_proxies.add(proxy_url)
@@ -478,9 +773,12 @@ class BaseScraper(ABC):
                         return self.make_request(url, use_selenium=True)
                     
                     response.raise_for_status()
-                    return response.text
+                    return html
                     
             except Exception as e:
+                if driver is not None:
+                    self._discard_driver(driver)
+                    driver = None
                 if attempt < max_retries - 1:
                     # Suppress verbose logging - just retry
                     time.sleep(2)
@@ -488,12 +786,170 @@ class BaseScraper(ABC):
                 else:
                     # Suppress verbose error logging
                     return None
+            finally:
+                if driver is not None:
+                    self._release_driver(driver)
         
         return None
     
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parse HTML content with BeautifulSoup"""
-        return BeautifulSoup(html, 'lxml')
+    def _get_session(self) -> requests.Session:
+        """Shared keep-alive session, created on first use with a connection pool sized for the worker threads"""
+        with self._session_lock:
+            if self.session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=SESSION_POOL_HOSTS, pool_maxsize=SESSION_POOL_MAXSIZE)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                self.session = session
+            return self.session
+    
+    def make_request_fast(self, url: str, timeout: int = 10) -> Optional[str]:
+        """
+        ✅ Single plain-HTTP GET for server-rendered pages (no Selenium, no retries)
+        
+        Returns None on errors, non-200 responses and captcha/block pages so the
+        caller can escalate to make_request(url, use_selenium=True)
+        """
+        self._throttle.wait()
+        session = self._get_session()
+        try:
+            response = session.get(url, headers=self._get_rotating_headers(), timeout=timeout,
+                                        proxies=self._get_requests_proxy_dict())
+        except requests.exceptions.RequestException as e:
+            logger.debug(f"{self.portal_name}: plain HTTP fetch failed for {url}: {e}")
+            return None
+        html = self._response_text(response)
+        if response.status_code != 200 or self._is_blocked_or_captcha(html, None):
+            logger.debug(f"{self.portal_name}: plain HTTP fetch not usable for {url} (status {response.status_code})")
+            return None
+        return html
+    
+    @staticmethod
+    def _response_text(response) -> str:
+        """
+        Response body as text. Pages that declare no charset are decoded as UTF-8 rather than
+        requests' ISO-8859-1 default / full-body charset detection pass
+        """
+        if 'charset' not in response.headers.get('Content-Type', '').lower():
+            response.encoding = 'utf-8'
+        return response.text
+    
+    def _retry_after_seconds(self, response) -> Optional[float]:
+        """Parse a Retry-After header (delta-seconds or HTTP-date) into seconds to wait"""
+        value = response.headers.get('Retry-After')
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    
+    def fetch_search_pages(self, urls: List[str], fetch=None,
+                           max_workers: int = DETAIL_FETCH_WORKERS) -> Iterator[Optional[str]]:
+        """
+        ✅ Load search pages (one per keyword) in parallel with a bounded thread pool
+        
+        Args:
+            urls: Search page URLs
+            fetch: Callable taking a URL (defaults to self._fetch_search_page)
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            HTML per URL (None on failure), yielded in URL order as the pages arrive -
+            Selenium loads check out drivers from the shared, bounded driver pool
+        """
+        fetch = fetch or self._fetch_search_page
+        if not urls:
+            return
+        
+        def _safe_fetch(url: str) -> Optional[str]:
+            try:
+                return fetch(url)
+            except Exception as e:
+                logger.debug(f"{self.portal_name}: Error fetching search page {url}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as executor:
+            yield from executor.map(_safe_fetch, urls)
+    
+    def _fetch_search_page(self, url: str) -> Optional[str]:
+        """Search page HTML - these listings are rendered client-side, so through Selenium"""
+        return self.make_request(url, use_selenium=True)
+    
+    def fetch_details_concurrently(self, job_links: Iterable[str], fetch=None,
+                                   max_workers: int = DETAIL_FETCH_WORKERS) -> Dict[str, Dict]:
+        """
+        ✅ Fetch job detail pages in parallel with a bounded thread pool
+        
+        Args:
+            job_links: Job detail URLs to fetch - may be a generator: links are drawn as
+                worker slots free up, so parsing overlaps the I/O
+            fetch: Callable taking a job link (defaults to self._fetch_job_detail)
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            Dict mapping job link -> detail dict (empty dict on failure)
+        """
+        fetch = fetch or getattr(self, '_fetch_job_detail', None)
+        if fetch is None:
+            return {}
+        
+        def _safe_fetch(job_link: str) -> Dict:
+            try:
+                return fetch(job_link) or {}
+            except Exception as e:
+                logger.debug(f"{self.portal_name}: Error fetching job detail for {job_link}: {e}")
+                return {}
+        
+        if isinstance(job_links, (list, tuple)):
+            if not job_links:
+                return {}
+            max_workers = min(max_workers, len(job_links))
+        
+        max_workers = max(1, max_workers)
+        futures = []
+        in_flight = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for job_link in job_links:
+                # ✅ At most max_workers fetches queued or running - the next link waits for a free slot
+                if len(in_flight) >= max_workers:
+                    _, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                future = executor.submit(_safe_fetch, job_link)
+                in_flight.add(future)
+                futures.append((job_link, future))
+        return {job_link: future.result() for job_link, future in futures}
+    
+    def fetch_detail_once(self, job_link: str, fetch=None) -> Dict:
+        """
+        ✅ Detail dict for a job link, fetched at most once per scraper instance
+        (the same posting often turns up under several keywords)
+        """
+        # ✅ One future per link: a second thread asking for the same link waits for the first fetch
+        with self._detail_lock:
+            future = self._detail_cache.get(job_link)
+            owner = future is None
+            if owner:
+                future = self._detail_cache[job_link] = Future()
+        if owner:
+            try:
+                future.set_result((fetch or self._fetch_job_detail)(job_link) or {})
+            except Exception as e:
+                # Not cached - a later call retries the fetch
+                with self._detail_lock:
+                    self._detail_cache.pop(job_link, None)
+                future.set_exception(e)
+                raise
+        return future.result()
+    
+    def parse_html(self, html: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+        """Parse HTML content with BeautifulSoup (lxml), optionally restricted by a SoupStrainer"""
+        return BeautifulSoup(html, 'lxml', parse_only=parse_only)
     
     def ensure_real_data(self, job_data: Dict) -> Dict:
         """
@@ -544,7 +1000,15 @@ class BaseScraper(ABC):
         if not date_str:
             return None
         
-        date_str = date_str.lower().strip()
+        date_str = date_str.strip()
+        # ✅ Fast path: ISO dates/timestamps go straight to date.fromisoformat (no keyword scans, no strptime loop)
+        if ISO_DATE_RE.match(date_str):
+            try:
+                return date.fromisoformat(date_str[:10])
+            except ValueError:
+                pass
+        
+        date_str = date_str.lower()
         now = datetime.now()
         
         try:
@@ -633,6 +1097,31 @@ class BaseScraper(ABC):
         # Strict match: keyword must be in job title
         return keyword_lower in job_title_lower
     
+    def matches_any_keyword(self, job_title: str) -> bool:
+        """
+        ✅ True if the job title contains ANY of the scraper's keywords
+        (same strict substring rule as matches_keyword, memoized per title)
+        """
+        if not job_title or self._keyword_re is None:
+            return False
+        title_lower = job_title.lower()
+        matched = self._keyword_matches.get(title_lower)
+        if matched is None:
+            matched = self._keyword_re.search(title_lower) is not None
+            self._keyword_matches[title_lower] = matched
+        return matched
+    
+    def is_new_link(self, job_link: str) -> bool:
+        """
+        ✅ True the first time a job link is seen by this scraper, False afterwards
+        (keeps a fixed-size 16-byte digest per link instead of the full URL)
+        """
+        digest = hashlib.blake2b(job_link.encode('utf-8'), digest_size=16).digest()
+        if digest in self._seen_link_digests:
+            return False
+        self._seen_link_digests.add(digest)
+        return True
+    
     def detect_job_type(self, job_title: str, location: str = '', description: str = '') -> str:
         """
         ✅ DETECT REAL JOB TYPE from job posting data
@@ -647,30 +1136,10 @@ class BaseScraper(ABC):
         """
         text = f"{job_title} {location} {description}".lower()
         
-        # Remote indicators (very strong)
-        remote_keywords = ['remote', 'work from home', 'wfh', 'anywhere', 'distributed', 'worldwide', 'location independent']
-        if any(word in text for word in remote_keywords):
-            return 'REMOTE'
-        
-        # Hybrid indicators
-        hybrid_keywords = ['hybrid', 'flexible location', 'office + remote', 'partially remote', 'flex']
-        if any(word in text for word in hybrid_keywords):
-            return 'HYBRID'
-        
-        # Freelance/Contract indicators
-        freelance_keywords = ['freelance', 'contract', 'contractor', 'temp', 'temporary', 'project-based', 'gig', 'consultancy']
-        if any(word in text for word in freelance_keywords):
-            return 'FREELANCE'
-        
-        # Part-time indicators
-        parttime_keywords = ['part-time', 'part time', 'parttime']
-        if any(word in text for word in parttime_keywords):
-            return 'PART_TIME'
-        
-        # Full-time indicators (only if explicitly mentioned)
-        fulltime_keywords = ['full-time', 'full time', 'fulltime', 'permanent', 'ft ', 'fte']
-        if any(word in text for word in fulltime_keywords):
-            return 'FULL_TIME'
+        for job_type, indicators in JOB_TYPE_INDICATORS:
+            for word in indicators:
+                if word in text:
+                    return job_type
         
         # ✅ Fallback: unknown when we cannot infer confidently
         return 'UNKNOWN'
@@ -733,7 +1202,10 @@ class BaseScraper(ABC):
         """Clean and normalize text"""
         if not text:
             return ""
-        return ' '.join(text.split()).strip()
+        # ✅ Long descriptions bypass the cache so they don't evict the short, repeated fields
+        if len(text) <= _CLEAN_TEXT_CACHE_LEN:
+            return _collapse_whitespace(text)
+        return ' '.join(text.split())
     
     def rate_limit_delay(self):
         """✅ STEP 3: Apply rate limiting delay with randomness"""
@@ -1017,44 +1489,16 @@ class BaseScraper(ABC):
     def _parse_company_size_from_count(self, count: any) -> str:
         """Convert employee count to size category"""
         try:
-            if isinstance(count, str):
-                count = int(''.join(filter(str.isdigit, count)))
-            else:
-                count = int(count)
-            
-            if count >= 10001:
-                return 'ENTERPRISE'
-            elif count >= 1001:
-                return 'LARGE'
-            elif count >= 51:
-                return 'MEDIUM'
-            else:
-                return 'SMALL'
-        except:
+            return company_size_category(_employee_count(count))
+        except (TypeError, ValueError, OverflowError):
             return 'UNKNOWN'
     
     def _parse_company_size_from_range(self, min_val: any, max_val: any) -> str:
-        """Convert employee range to size category"""
+        """Convert employee range to size category (the upper bound decides)"""
         try:
-            if isinstance(min_val, str):
-                min_val = int(''.join(filter(str.isdigit, min_val)))
-            else:
-                min_val = int(min_val)
-            
-            if isinstance(max_val, str):
-                max_val = int(''.join(filter(str.isdigit, max_val)))
-            else:
-                max_val = int(max_val)
-            
-            if max_val >= 10001:
-                return 'ENTERPRISE'
-            elif max_val >= 1001:
-                return 'LARGE'
-            elif max_val >= 51:
-                return 'MEDIUM'
-            else:
-                return 'SMALL'
-        except:
+            _employee_count(min_val)  # validated only, as before
+            return company_size_category(_employee_count(max_val))
+        except (TypeError, ValueError, OverflowError):
             return 'UNKNOWN'
     
     def _is_blocked_or_captcha(self, html: str, driver=None) -> bool:
@@ -0,0 +1,138 @@
+"""
+Shared Selenium WebDriver pool
+Drivers are launched lazily, checked out by one thread at a time (WebDriver is not
+thread-safe) and reused across keywords, detail pages and scrapers
+"""
+import atexit
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+# ✅ Warm drivers kept between requests/scrapers - extra ones are quit on release
+MAX_IDLE_DRIVERS = 4
+# ✅ Chrome processes alive at once (idle + checked out) - further acquire() calls wait for one
+MAX_LIVE_DRIVERS = 6
+# ✅ Seconds end_run() waits for checked-out drivers to come back before quitting them anyway
+DRAIN_TIMEOUT = 60
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.debug(f"Error quitting driver: {e}")
+
+
+class DriverPool:
+    """Pool of reusable WebDriver instances, bounded to max_live drivers"""
+    
+    def __init__(self, max_idle: int = MAX_IDLE_DRIVERS, max_live: int = MAX_LIVE_DRIVERS):
+        self.max_idle = max_idle
+        self.max_live = max(1, max_live)
+        self._idle = []  # most recently used (warmest) driver last
+        self._drivers = set()  # every live driver, idle or checked out
+        self._launching = 0  # slots reserved by launches still in progress
+        self._runs = 0  # scraper runs currently using the pool
+        self._cond = threading.Condition()
+    
+    def _live(self) -> int:
+        return len(self._drivers) + self._launching
+    
+    def acquire(self, launch: Callable):
+        """
+        Check out an idle driver, calling launch() only when none is free and fewer than
+        max_live drivers are alive - otherwise block until one is released or quit
+        """
+        with self._cond:
+            while not self._idle and self._live() >= self.max_live:
+                self._cond.wait()
+            if self._idle:
+                return self._idle.pop()
+            self._launching += 1
+        driver = None
+        try:
+            driver = launch()
+        finally:
+            with self._cond:
+                self._launching -= 1
+                if driver is not None:
+                    self._drivers.add(driver)
+                else:
+                    self._cond.notify()  # launch failed - hand the slot to a waiter
+        return driver
+    
+    def release(self, driver):
+        """Return a healthy driver for reuse (quit when max_idle drivers are already waiting)"""
+        with self._cond:
+            if driver not in self._drivers:
+                return  # already quit by close()
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                self._cond.notify()
+                return
+            self._drivers.discard(driver)
+            self._cond.notify()
+        _quit(driver)
+    
+    def discard(self, driver):
+        """Quit a driver (failed load / blocked) so the next request launches a fresh one"""
+        with self._cond:
+            self._drivers.discard(driver)
+            self._cond.notify()
+        _quit(driver)
+    
+    def close_idle(self):
+        """Quit the idle drivers - drivers still checked out keep working"""
+        with self._cond:
+            idle, self._idle = self._idle, []
+            self._drivers.difference_update(idle)
+            self._cond.notify_all()
+        for driver in idle:
+            _quit(driver)
+    
+    def begin_run(self):
+        """Register a scraper run - the pool is drained when the last one ends"""
+        with self._cond:
+            self._runs += 1
+            self._cond.notify_all()  # wake an end_run() still draining for the previous run
+    
+    def end_run(self, timeout: float = DRAIN_TIMEOUT):
+        """
+        Unregister a scraper run; when it was the last one, wait for checked-out drivers to be
+        released (up to timeout seconds) and quit every driver, so none outlive the run.
+        A run that begins while we wait takes the pool over and nothing is quit
+        """
+        with self._cond:
+            self._runs = max(0, self._runs - 1)
+            if self._runs:
+                return
+            drained = self._cond.wait_for(
+                lambda: self._runs or (not self._launching and len(self._idle) == len(self._drivers)),
+                timeout,
+            )
+            if self._runs:
+                return  # wait_for dropped the lock and another run began - its drivers stay
+            # Swapped out under the lock, so no new run can check one of them out before it is quit
+            drivers, self._drivers = self._drivers, set()
+            self._idle = []
+            self._cond.notify_all()
+        if not drained:
+            logger.warning(f"Quitting Selenium drivers still checked out after {timeout}s")
+        for driver in drivers:
+            _quit(driver)
+    
+    def close(self):
+        """Quit every driver, idle or checked out"""
+        with self._cond:
+            drivers, self._drivers = self._drivers, set()
+            self._idle = []
+            self._cond.notify_all()
+        for driver in drivers:
+            _quit(driver)
+
+
+# One pool for the whole process - quit everything at interpreter exit
+shared_pool = DriverPool()
+atexit.register(shared_pool.close)
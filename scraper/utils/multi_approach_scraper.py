@@ -4,10 +4,11 @@ Tries multiple methods to extract jobs from any portal
 """
 import logging
 import re
-import json
 from typing import List, Dict, Optional
 from bs4 import BeautifulSoup
 
+from .base_scraper import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -34,10 +35,8 @@ class MultiApproachExtractor:
             ('div', {'class': 'job-result'}),
             ('div', {'class': 'job-listing'}),
             ('article', {'class': 'job-card'}),
-            ('div', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ('article', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
-            ('li', {'class': lambda x: x and 'job' in ' '.join(x).lower()}),
         ]
+        # (Partial "job" class matches are covered by the [class*="job"] selectors in APPROACH 2)
         
         for tag, attrs in standard_selectors:
             try:
@@ -126,7 +125,11 @@ class MultiApproachExtractor:
             json_ld_count = 0
             for script in scripts:
                 try:
-                    data = json.loads(script.get_text(strip=True) or '{}')
+                    # JSON-LD blocks have a single text child - read it as is, skip blocks without a JobPosting
+                    raw = script.string
+                    if not raw or 'JobPosting' not in raw:
+                        continue
+                    data = json_loads(raw)
                     if isinstance(data, dict):
                         # Handle @graph
                         if '@graph' in data: